@@ -1,13 +1,12 @@
 ﻿from __future__ import annotations
 
-import os
 from logging.config import fileConfig
-from pathlib import Path
 
-from sqlalchemy import create_engine, pool
+from sqlalchemy import create_engine
 
 import app.db.models  # noqa: F401 - ensure models are registered with metadata
 from alembic import context
+from app.core.config import DatabaseSettings
 from app.db.base import Base
 
 config = context.config
@@ -19,23 +18,13 @@ target_metadata = Base.metadata
 
 
 def _get_database_url() -> str:
-    url = os.getenv("DATABASE_URL") or config.get_main_option("sqlalchemy.url")
+    # An explicit URL (`-x sqlalchemy.url=...` or alembic.ini) wins over the environment.
+    url = context.get_x_argument(as_dictionary=True).get("sqlalchemy.url")
+    url = url or config.get_main_option("sqlalchemy.url")
     if url:
         return url
-
-    env_path = Path(__file__).resolve().parents[1] / ".env"
-    if env_path.exists():
-        for line in env_path.read_text(encoding="utf-8").splitlines():
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#") or "=" not in stripped:
-                continue
-            key, value = stripped.split("=", 1)
-            if key.strip() == "DATABASE_URL":
-                return value.strip().strip('"').strip("'")
-
-    raise RuntimeError(
-        "Missing DATABASE_URL. Set it in the environment or provide it in a .env file."
-    )
+    # Only the database fields are needed here, not the app's LLM or logging settings.
+    return DatabaseSettings().database_url
 
 
 def run_migrations_offline() -> None:
@@ -52,7 +41,7 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
-    connectable = create_engine(_get_database_url(), poolclass=pool.NullPool)
+    connectable = create_engine(_get_database_url())
 
     with connectable.connect() as connection:
         context.configure(
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import sqlalchemy as sa
 
-from alembic import op
+from alembic import context, op
 
 revision = "20260127_0003"
 down_revision = "20260127_0002"
@@ -17,21 +17,52 @@ branch_labels = None
 depends_on = None
 
 
+BACKFILL_BATCH_SIZE = 30_000
+# Server-side equivalent of len(summary.split()).
+WORD_COUNT_SQL = r"""
+COALESCE(
+    array_length(
+        regexp_split_to_array(
+            NULLIF(regexp_replace(summary, '^\s+|\s+$', '', 'g'), ''),
+            '\s+'
+        ),
+        1
+    ),
+    0
+)
+"""
+
+
+def _backfill_word_count() -> None:
+    """Backfill word_count in id-range batches, committing each batch separately."""
+
+    update_all = f"UPDATE summaries SET word_count = {WORD_COUNT_SQL}"
+    if context.is_offline_mode():
+        op.execute(sa.text(update_all))
+        return
+
+    min_id, max_id = op.get_bind().execute(sa.text("SELECT MIN(id), MAX(id) FROM summaries")).one()
+    if min_id is None:
+        return
+
+    # Commit the column addition first so each batch holds its row locks only briefly.
+    with op.get_context().autocommit_block():
+        for lower in range(min_id, max_id + 1, BACKFILL_BATCH_SIZE):
+            op.execute(
+                sa.text(f"{update_all} WHERE id >= :lower AND id < :upper").bindparams(
+                    lower=lower,
+                    upper=lower + BACKFILL_BATCH_SIZE,
+                )
+            )
+
+
 def upgrade() -> None:
     op.add_column(
         "summaries",
         sa.Column("word_count", sa.Integer(), nullable=False, server_default="0"),
     )
 
-    connection = op.get_bind()
-    rows = connection.execute(sa.text("SELECT id, summary FROM summaries")).fetchall()
-    for row in rows:
-        summary_text = row.summary or ""
-        word_count = len(summary_text.split())
-        connection.execute(
-            sa.text("UPDATE summaries SET word_count = :word_count WHERE id = :id"),
-            {"word_count": word_count, "id": row.id},
-        )
+    _backfill_word_count()
 
     op.alter_column("summaries", "word_count", server_default=None)
 
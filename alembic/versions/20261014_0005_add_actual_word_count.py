@@ -0,0 +1,72 @@
+"""add actual_word_count column
+
+Revision ID: 20261014_0005
+Revises: 20260127_0004
+Create Date: 2026-10-14 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+revision = "20261014_0005"
+down_revision = "20260127_0004"
+branch_labels = None
+depends_on = None
+
+
+BACKFILL_BATCH_SIZE = 30_000
+# Mirrors app.db.models._count_summary_words (len(summary.split())), so backfilled rows
+# match counts written at insert time. Kept local: migrations must not import each other.
+WORD_COUNT_SQL = r"""
+COALESCE(
+    array_length(
+        regexp_split_to_array(
+            NULLIF(regexp_replace(summary, '^\s+|\s+$', '', 'g'), ''),
+            '\s+'
+        ),
+        1
+    ),
+    0
+)
+"""
+
+
+def _backfill_actual_word_count() -> None:
+    """Count words for existing rows in id-range batches."""
+
+    update_all = f"UPDATE summaries SET actual_word_count = {WORD_COUNT_SQL}"
+    if context.is_offline_mode():
+        op.execute(sa.text(update_all))
+        return
+
+    min_id, max_id = op.get_bind().execute(sa.text("SELECT MIN(id), MAX(id) FROM summaries")).one()
+    if min_id is None:
+        return
+
+    # Commit the new column first; each batch then commits and releases its locks on its own.
+    with op.get_context().autocommit_block():
+        for lower in range(min_id, max_id + 1, BACKFILL_BATCH_SIZE):
+            op.execute(
+                sa.text(f"{update_all} WHERE id >= :lower AND id < :upper").bindparams(
+                    lower=lower,
+                    upper=lower + BACKFILL_BATCH_SIZE,
+                )
+            )
+
+
+def upgrade() -> None:
+    op.add_column(
+        "summaries",
+        sa.Column("actual_word_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    _backfill_actual_word_count()
+
+    op.alter_column("summaries", "actual_word_count", server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column("summaries", "actual_word_count")
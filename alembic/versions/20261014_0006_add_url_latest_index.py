@@ -0,0 +1,29 @@
+"""index summaries by url and newest id
+
+Revision ID: 20261014_0006
+Revises: 20261014_0005
+Create Date: 2026-10-14 11:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20261014_0006"
+down_revision = "20261014_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves "latest summary for a URL" (ORDER BY id DESC LIMIT 1) without a sort.
+    op.create_index("ix_summaries_url_id", "summaries", ["url", sa.text("id DESC")])
+    # Plain URL lookups are already covered by the (url, word_count) unique constraint.
+    op.drop_index("ix_summaries_url", table_name="summaries")
+
+
+def downgrade() -> None:
+    op.create_index("ix_summaries_url", "summaries", ["url"], unique=False)
+    op.drop_index("ix_summaries_url_id", table_name="summaries")
@@ -1,34 +1,45 @@
 from __future__ import annotations
 
 import logging
+import time
 
-import redis  # type: ignore[reportMissingImports]
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.core import ratelimit
 from app.core.config import get_settings
 from app.db.session import get_session
 
 router = APIRouter(prefix="/health", tags=["health"])
 logger = logging.getLogger(__name__)
 
+READY_CACHE_TTL_SECONDS = 2.0
+_ready_cache: tuple[float, dict[str, object]] | None = None
+
 
 @router.get("/live", status_code=status.HTTP_200_OK)
-def live() -> dict[str, str]:
+async def live() -> dict[str, str]:
     """Basic liveness probe."""
 
     return {"status": "ok"}
 
 
 @router.get("/ready", status_code=status.HTTP_200_OK)
-def ready(session: Session = Depends(get_session)) -> dict[str, object]:
+async def ready(session: Session = Depends(get_session)) -> dict[str, object]:
     """Readiness probe that validates core dependencies."""
 
+    global _ready_cache
+    now = time.monotonic()
+    if _ready_cache is not None and now - _ready_cache[0] < READY_CACHE_TTL_SECONDS:
+        return _ready_cache[1]
+
     checks: dict[str, str] = {}
 
     try:
-        session.execute(text("SELECT 1"))
+        # The DB stack is synchronous; keep the query off the event loop.
+        await run_in_threadpool(session.execute, text("SELECT 1"))
         checks["db"] = "ok"
     except Exception as exc:
         logger.exception("Readiness check failed for database.")
@@ -39,11 +50,15 @@ def ready(session: Session = Depends(get_session)) -> dict[str, object]:
         ) from exc
 
     settings = get_settings()
-    if settings.rate_limit_enabled:
+    redis_client = ratelimit.redis_client
+    if not settings.rate_limit_enabled:
+        checks["redis"] = "disabled"
+    elif redis_client is None:
+        checks["redis"] = "memory"
+    else:
         try:
-            client = redis.from_url(settings.rate_limit_redis_url)
-            client.ping()
-            client.close()
+            # Reuses the rate limiter's sync client (and pool); keep the ping off the event loop.
+            await run_in_threadpool(redis_client.ping)
             checks["redis"] = "ok"
         except Exception as exc:
             logger.exception("Readiness check failed for Redis.")
@@ -52,7 +67,8 @@ def ready(session: Session = Depends(get_session)) -> dict[str, object]:
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail={"status": "error", "checks": checks},
             ) from exc
-    else:
-        checks["redis"] = "disabled"
 
-    return {"status": "ok", "checks": checks}
+    result: dict[str, object] = {"status": "ok", "checks": checks}
+    # Only successful probes are cached so failures are re-checked immediately.
+    _ready_cache = (now, result)
+    return result
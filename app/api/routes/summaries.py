@@ -24,11 +24,18 @@ settings = get_settings()
 SourceLiteral = Literal["generated", "cache"]
 
 
+def get_orchestrator(session: Session = Depends(get_session)) -> SummaryOrchestrator:
+    """Provide a request-scoped orchestrator bound to the request's DB session."""
+
+    return SummaryOrchestrator(session)
+
+
 def _build_response(summary_obj: Summary, source: SourceLiteral) -> SummaryResponse:
-    return SummaryResponse(
+    # Fields come straight from a persisted row, so skip re-validating them here.
+    return SummaryResponse.model_construct(
         url=summary_obj.url,
         word_count=summary_obj.word_count,
-        actual_word_count=len(summary_obj.summary.split()),
+        actual_word_count=summary_obj.actual_word_count,
         summary=summary_obj.summary,
         summary_pt=summary_obj.summary_pt,
         summary_origin=summary_obj.summary_origin,
@@ -48,7 +55,7 @@ def _build_response(summary_obj: Summary, source: SourceLiteral) -> SummaryRespo
 def create_summary(
     request: Request,
     payload: SummaryCreate,
-    session: Session = Depends(get_session),
+    orchestrator: SummaryOrchestrator = Depends(get_orchestrator),
 ) -> SummaryResponse:
     if payload.word_count > settings.summary_word_count_max:
         raise HTTPException(
@@ -56,7 +63,6 @@ def create_summary(
             detail=f"word_count must be <= {settings.summary_word_count_max}.",
         )
 
-    orchestrator = SummaryOrchestrator(session)
     try:
         summary_obj, source = orchestrator.get_or_create_summary(payload.url, payload.word_count)
     except InvalidInputError as exc:
@@ -88,9 +94,8 @@ def get_summary(
         description="Requested word count. If omitted, returns the most recent summary for the URL.",
         examples=[200],
     ),
-    session: Session = Depends(get_session),
+    orchestrator: SummaryOrchestrator = Depends(get_orchestrator),
 ) -> SummaryResponse:
-    orchestrator = SummaryOrchestrator(session)
     try:
         existing = orchestrator.get_summary_by_url(url, word_count)
     except InvalidInputError as exc:
@@ -1,78 +1,20 @@
 ﻿from __future__ import annotations
 
-import os
-from functools import lru_cache, partial
+from functools import cached_property, lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+PLACEHOLDER_API_KEYS = frozenset({"your-openai-api-key"})
 
-def _env_required(name: str) -> str:
-    """Return a required environment variable or raise a clear error."""
 
-    value = os.getenv(name)
-    if value is None or value == "":
-        raise RuntimeError(f"Missing required environment variable: {name}")
-    return value
-
-
-def _env_optional(name: str, default: str) -> str:
-    """Return an environment variable value or a safe default."""
-
-    value = os.getenv(name)
-    if value is None or value == "":
-        return default
-    return value
-
-
-def _env_optional_bool(name: str, default: bool) -> bool:
-    """Return a boolean environment variable value or a safe default."""
-
-    value = os.getenv(name)
-    if value is None or value == "":
-        return default
-
-    normalized = value.strip().lower()
-    if normalized in {"1", "true", "yes", "on"}:
-        return True
-    if normalized in {"0", "false", "no", "off"}:
-        return False
-
-    raise RuntimeError(f"Invalid boolean value for {name}: {value}")
-
-
-def _env_optional_float(name: str, default: float) -> float:
-    """Return a float environment variable value or a safe default."""
-
-    value = os.getenv(name)
-    if value is None or value == "":
-        return default
-
-    try:
-        return float(value)
-    except ValueError as exc:
-        raise RuntimeError(f"Invalid float value for {name}: {value}") from exc
-
-
-def _env_optional_int(name: str, default: int) -> int:
-    """Return an integer environment variable value or a safe default."""
-
-    value = os.getenv(name)
-    if value is None or value == "":
-        return default
-
-    try:
-        return int(value)
-    except ValueError as exc:
-        raise RuntimeError(f"Invalid integer value for {name}: {value}") from exc
-
-
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+class DatabaseSettings(BaseSettings):
+    """Database connection settings; loadable without the rest of the app config."""
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
+        env_ignore_empty=True,
         extra="ignore",
     )
 
@@ -88,140 +30,203 @@ class Settings(BaseSettings):
     postgres_host: str = Field(default="db", alias="POSTGRES_HOST", description="Postgres host.")
     postgres_port: int = Field(default=5432, alias="POSTGRES_PORT", description="Postgres port.")
 
+    database_url_override: str | None = Field(
+        default=None,
+        alias="DATABASE_URL",
+        description="Full database URL; overrides the Postgres components when set.",
+    )
+
     @property
     def database_url(self) -> str:
         """Construct database URL from env var or components."""
-        if url := os.getenv("DATABASE_URL"):
-            return url
+        if self.database_url_override:
+            return self.database_url_override
 
         return (
             f"postgresql+psycopg://{self.postgres_user}:{self.postgres_password}"
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
+
+class Settings(DatabaseSettings):
+    """Application settings loaded from environment variables."""
+
+    db_pool_size: int = Field(
+        default=20,
+        alias="DB_POOL_SIZE",
+        description="Number of persistent connections kept in the database pool.",
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        alias="DB_MAX_OVERFLOW",
+        description="Extra connections allowed beyond the pool size under load.",
+    )
+    db_pool_recycle_seconds: int = Field(
+        default=1800,
+        alias="DB_POOL_RECYCLE_SECONDS",
+        description="Recycle pooled database connections older than this (seconds).",
+    )
+    db_pool_timeout_seconds: float = Field(
+        default=30.0,
+        alias="DB_POOL_TIMEOUT_SECONDS",
+        description="Time to wait for a pooled database connection (seconds).",
+    )
+    threadpool_max_workers: int = Field(
+        default=40,
+        alias="THREADPOOL_MAX_WORKERS",
+        description="Maximum worker threads running sync routes (blocking scrape/LLM calls).",
+    )
+
     openai_api_key: str = Field(
-        default_factory=partial(_env_required, "OPENAI_API_KEY"),
+        ...,
         alias="OPENAI_API_KEY",
         description="OpenAI API key used by LangChain.",
     )
     openai_model: str = Field(
-        default_factory=partial(_env_required, "OPENAI_MODEL"),
+        ...,
         alias="OPENAI_MODEL",
         description="OpenAI model name used for summarization.",
     )
     openai_fallback_model: str = Field(
-        default_factory=partial(_env_optional, "OPENAI_FALLBACK_MODEL", ""),
+        default="",
         alias="OPENAI_FALLBACK_MODEL",
         description="Fallback OpenAI model name used when the primary model fails.",
     )
+
+    @cached_property
+    def llm_available(self) -> bool:
+        """Whether a real (non-placeholder) OpenAI API key is configured."""
+
+        key = self.openai_api_key.strip()
+        return bool(key) and key not in PLACEHOLDER_API_KEYS
+
+    @cached_property
+    def fallback_model(self) -> str | None:
+        """Fallback OpenAI model, or None when unset or equal to the primary model."""
+
+        fallback = self.openai_fallback_model.strip()
+        if not fallback or fallback == self.openai_model:
+            return None
+        return fallback
+
     log_level: str = Field(
-        default_factory=partial(_env_required, "LOG_LEVEL"),
+        ...,
         alias="LOG_LEVEL",
         description="Application log level.",
     )
     log_debug_enabled: bool = Field(
-        default_factory=partial(_env_optional_bool, "LOG_DEBUG_ENABLED", True),
+        default=True,
         alias="LOG_DEBUG_ENABLED",
         description="Enable DEBUG logs when true.",
     )
     log_info_enabled: bool = Field(
-        default_factory=partial(_env_optional_bool, "LOG_INFO_ENABLED", True),
+        default=True,
         alias="LOG_INFO_ENABLED",
         description="Enable INFO logs when true.",
     )
     log_warning_enabled: bool = Field(
-        default_factory=partial(_env_optional_bool, "LOG_WARNING_ENABLED", True),
+        default=True,
         alias="LOG_WARNING_ENABLED",
         description="Enable WARNING logs when true.",
     )
     log_error_enabled: bool = Field(
-        default_factory=partial(_env_optional_bool, "LOG_ERROR_ENABLED", True),
+        default=True,
         alias="LOG_ERROR_ENABLED",
         description="Enable ERROR logs when true.",
     )
     log_critical_enabled: bool = Field(
-        default_factory=partial(_env_optional_bool, "LOG_CRITICAL_ENABLED", True),
+        default=True,
         alias="LOG_CRITICAL_ENABLED",
         description="Enable CRITICAL logs when true.",
     )
     http_timeout_seconds: float = Field(
-        default_factory=partial(_env_optional_float, "HTTP_TIMEOUT_SECONDS", 10.0),
+        default=10.0,
         alias="HTTP_TIMEOUT_SECONDS",
         description="Timeout for Wikipedia HTTP requests in seconds.",
     )
     llm_timeout_seconds: float = Field(
-        default_factory=partial(_env_optional_float, "LLM_TIMEOUT_SECONDS", 30.0),
+        default=30.0,
         alias="LLM_TIMEOUT_SECONDS",
         description="Timeout for LLM requests in seconds.",
     )
     llm_max_retries: int = Field(
-        default_factory=partial(_env_optional_int, "LLM_MAX_RETRIES", 2),
+        default=2,
         alias="LLM_MAX_RETRIES",
         description="Number of retry attempts for LLM calls on transient failures.",
     )
     llm_retry_backoff_seconds: float = Field(
-        default_factory=partial(_env_optional_float, "LLM_RETRY_BACKOFF_SECONDS", 1.0),
+        default=1.0,
         alias="LLM_RETRY_BACKOFF_SECONDS",
         description="Base backoff (seconds) between LLM retries.",
     )
+    llm_max_parallel_chunks: int = Field(
+        default=4,
+        alias="LLM_MAX_PARALLEL_CHUNKS",
+        description="Maximum concurrent LLM calls during the map step of long articles.",
+    )
     wikipedia_user_agent: str = Field(
-        default_factory=partial(_env_required, "WIKIPEDIA_USER_AGENT"),
+        ...,
         alias="WIKIPEDIA_USER_AGENT",
         description="User-Agent header used for Wikipedia requests.",
     )
     wikipedia_min_article_words: int = Field(
-        default_factory=partial(_env_optional_int, "WIKIPEDIA_MIN_ARTICLE_WORDS", 50),
+        default=50,
         alias="WIKIPEDIA_MIN_ARTICLE_WORDS",
         description="Minimum number of extracted words required to summarize.",
     )
     wikipedia_max_content_bytes: int = Field(
-        default_factory=partial(_env_optional_int, "WIKIPEDIA_MAX_CONTENT_BYTES", 2_000_000),
+        default=2_000_000,
         alias="WIKIPEDIA_MAX_CONTENT_BYTES",
         description="Maximum number of bytes allowed when downloading Wikipedia content.",
     )
     wikipedia_max_redirects: int = Field(
-        default_factory=partial(_env_optional_int, "WIKIPEDIA_MAX_REDIRECTS", 5),
+        default=5,
         alias="WIKIPEDIA_MAX_REDIRECTS",
         description="Maximum number of redirects allowed for Wikipedia requests.",
     )
     summary_word_count_max: int = Field(
-        default_factory=partial(_env_optional_int, "SUMMARY_WORD_COUNT_MAX", 500),
+        default=500,
         alias="SUMMARY_WORD_COUNT_MAX",
         description="Maximum allowed word_count value for summaries.",
     )
     enable_portuguese_translation: bool = Field(
-        default_factory=partial(_env_optional_bool, "ENABLE_PORTUGUESE_TRANSLATION", True),
+        default=True,
         alias="ENABLE_PORTUGUESE_TRANSLATION",
         description="Enable Portuguese translation when true.",
     )
+    summary_cache_ttl_seconds: int = Field(
+        default=86400,
+        alias="SUMMARY_CACHE_TTL_SECONDS",
+        description="TTL for summaries cached in Redis (seconds); 0 disables the cache.",
+    )
 
     rate_limit_enabled: bool = Field(
-        default_factory=partial(_env_optional_bool, "RATE_LIMIT_ENABLED", True),
+        default=True,
         alias="RATE_LIMIT_ENABLED",
         description="Enable rate limiting when true.",
     )
     rate_limit_redis_url: str = Field(
-        default_factory=partial(_env_optional, "RATE_LIMIT_REDIS_URL", "redis://redis:6379/0"),
+        default="redis://redis:6379/0",
         alias="RATE_LIMIT_REDIS_URL",
         description="Redis URL used for rate limiting storage.",
     )
     rate_limit_trust_proxy_headers: bool = Field(
-        default_factory=partial(_env_optional_bool, "RATE_LIMIT_TRUST_PROXY_HEADERS", False),
+        default=False,
         alias="RATE_LIMIT_TRUST_PROXY_HEADERS",
         description="Trust X-Forwarded-For/X-Real-IP headers when determining client IP.",
     )
     rate_limit_default: str = Field(
-        default_factory=partial(_env_optional, "RATE_LIMIT_DEFAULT", "120/minute"),
+        default="120/minute",
         alias="RATE_LIMIT_DEFAULT",
         description="Default generous rate limit applied globally.",
     )
     rate_limit_post_summaries: str = Field(
-        default_factory=partial(_env_optional, "RATE_LIMIT_POST_SUMMARIES", "30/minute"),
+        default="30/minute",
         alias="RATE_LIMIT_POST_SUMMARIES",
         description="Generous rate limit for POST /summaries.",
     )
     rate_limit_get_summaries: str = Field(
-        default_factory=partial(_env_optional, "RATE_LIMIT_GET_SUMMARIES", "300/minute"),
+        default="300/minute",
         alias="RATE_LIMIT_GET_SUMMARIES",
         description="Generous rate limit for GET /summaries.",
     )
@@ -231,4 +236,5 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Return a cached Settings instance."""
 
-    return Settings()
+    # Required fields are populated from the environment (or .env) by pydantic-settings.
+    return Settings()  # pyright: ignore[reportCallIssue]
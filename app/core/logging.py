@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import atexit
 import contextvars
-import json
 import logging
+import queue
 import re
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+import orjson
+
 from app.core.config import get_settings
 
 _REQUEST_ID: contextvars.ContextVar[str | None] = contextvars.ContextVar(
@@ -15,6 +19,7 @@ _REQUEST_ID: contextvars.ContextVar[str | None] = contextvars.ContextVar(
 )
 _URL_QUERY_RE = re.compile(r"(https?://\S+?)\?(\S+)")
 _PATH_QUERY_RE = re.compile(r"(\s/\S+?)\?(\S+)")
+_listener: QueueListener | None = None
 
 
 def set_request_id(request_id: str | None) -> contextvars.Token[str | None]:
@@ -30,6 +35,10 @@ def get_request_id() -> str | None:
 
 
 def _redact_message(message: str) -> str:
+    # Not memoized: access-log lines carry the client ip:port, so they are nearly all
+    # unique, and a cache would keep unredacted query strings in memory.
+    if "?" not in message:
+        return message
     message = _URL_QUERY_RE.sub(r"\1?redacted", message)
     return _PATH_QUERY_RE.sub(r"\1?redacted", message)
 
@@ -54,7 +63,7 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_record)
+        return orjson.dumps(log_record).decode("utf-8")
 
 
 class LevelToggleFilter(logging.Filter):
@@ -70,30 +79,53 @@ class LevelToggleFilter(logging.Filter):
         critical: bool,
     ) -> None:
         super().__init__()
+        self._thresholds: tuple[tuple[int, bool], ...] = (
+            (logging.CRITICAL, critical),
+            (logging.ERROR, error),
+            (logging.WARNING, warning),
+            (logging.INFO, info),
+        )
         self._debug = debug
-        self._info = info
-        self._warning = warning
-        self._error = error
-        self._critical = critical
+        # Resolved per level number on first use; standard levels are seeded up front.
+        self._enabled: dict[int, bool] = {
+            logging.DEBUG: debug,
+            logging.INFO: info,
+            logging.WARNING: warning,
+            logging.ERROR: error,
+            logging.CRITICAL: critical,
+        }
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        if record.levelno >= logging.CRITICAL:
-            return self._critical
-        if record.levelno >= logging.ERROR:
-            return self._error
-        if record.levelno >= logging.WARNING:
-            return self._warning
-        if record.levelno >= logging.INFO:
-            return self._info
+    def _resolve(self, levelno: int) -> bool:
+        for threshold, enabled in self._thresholds:
+            if levelno >= threshold:
+                return enabled
         return self._debug
 
+    def filter(self, record: logging.LogRecord) -> bool:
+        enabled = self._enabled.get(record.levelno)
+        if enabled is None:
+            enabled = self._enabled[record.levelno] = self._resolve(record.levelno)
+        return enabled
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def configure_logging() -> None:
-    """Configure application logging using a JSON formatter."""
+    """Configure application logging using a JSON formatter.
+
+    Records are formatted on the calling thread (so request IDs are captured) and
+    handed to a background listener that performs the blocking stdout writes.
+    """
+    global _listener
     settings = get_settings()
     log_level = settings.log_level.upper()
 
-    handler = logging.StreamHandler(sys.stdout)
+    handler = QueueHandler(queue.SimpleQueue())
     handler.setFormatter(JSONFormatter())
     handler.addFilter(
         LevelToggleFilter(
@@ -105,6 +137,10 @@ def configure_logging() -> None:
         )
     )
 
+    _stop_listener()
+    _listener = QueueListener(handler.queue, logging.StreamHandler(sys.stdout))
+    _listener.start()
+
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
@@ -120,3 +156,6 @@ def configure_logging() -> None:
         uvicorn_logger.setLevel(log_level)
         uvicorn_logger.handlers = [handler]
         uvicorn_logger.propagate = False
+
+
+atexit.register(_stop_listener)
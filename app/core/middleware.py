@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import itertools
+import os
+import secrets
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import reset_request_id, set_request_id
+
+# Raw (lowercase) header pairs so they can be appended without per-response lookups.
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"cache-control", b"no-store"),
+    (b"pragma", b"no-cache"),
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"no-referrer"),
+)
+
+# Request IDs are a random per-process prefix plus a counter: unique like uuid4 hex
+# (same 32-char width) without an os.urandom call per request.
+_request_id_prefix = secrets.token_hex(8)
+_request_id_counter = itertools.count()
+
+
+def _reseed_request_ids() -> None:
+    global _request_id_prefix, _request_id_counter
+    _request_id_prefix = secrets.token_hex(8)
+    _request_id_counter = itertools.count()
+
+
+# Forked workers (e.g. gunicorn --preload) must not share the parent's prefix.
+os.register_at_fork(after_in_child=_reseed_request_ids)
+
+
+def new_request_id() -> str:
+    return f"{_request_id_prefix}{next(_request_id_counter):016x}"
+
+
+class RequestEnvelopeMiddleware:
+    """Bind the request ID for logging and add request-ID and security response headers.
+
+    Implemented as plain ASGI (not BaseHTTPMiddleware) so it adds no extra task or
+    call_next hop per request; headers are patched on ``http.response.start``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id") or new_request_id()
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                content_type = headers.get("content-type", "")
+                # Parameter names are case-insensitive (e.g. "Charset=UTF-8").
+                if (
+                    content_type.startswith("application/json")
+                    and "charset=" not in content_type.lower()
+                ):
+                    headers["content-type"] = f"{content_type}; charset=utf-8"
+                raw_headers = headers.raw
+                present = {name for name, _ in raw_headers}
+                raw_headers.extend(
+                    header for header in _SECURITY_HEADERS if header[0] not in present
+                )
+                headers["x-request-id"] = request_id
+            await send(message)
+
+        # Each request runs in its own task with a copied context; the reset is a safeguard.
+        token = set_request_id(request_id)
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            reset_request_id(token)
@@ -4,7 +4,9 @@ import logging
 from collections.abc import Callable
 from typing import TypeVar
 
+import redis  # type: ignore[reportMissingImports]
 from fastapi import Request
+from limits import parse_many
 from slowapi import Limiter
 
 from app.core.config import get_settings
@@ -37,11 +39,16 @@ def _get_client_ip(request: Request) -> str:
 rate_limit_enabled = settings.rate_limit_enabled
 limiter: Limiter | None = None
 
+# Sliding window kept in the shared storage, so every worker enforces the same limit.
+# On Redis, `limits` applies it atomically through a cached Lua script (EVALSHA).
+RATE_LIMIT_STRATEGY = "moving-window"
+
 if rate_limit_enabled:
     try:
         limiter = Limiter(
             key_func=_get_client_ip,
             storage_uri=settings.rate_limit_redis_url,
+            strategy=RATE_LIMIT_STRATEGY,
             default_limits=[settings.rate_limit_default],
         )
     except Exception as exc:  # pragma: no cover - defensive fallback
@@ -53,15 +60,28 @@ if rate_limit_enabled:
         limiter = Limiter(
             key_func=_get_client_ip,
             storage_uri="memory://",
+            strategy=RATE_LIMIT_STRATEGY,
             default_limits=[settings.rate_limit_default],
         )
 
+# Expose the limiter's Redis client so other Redis consumers share its connection pool.
+redis_client: redis.Redis | None = None
+if limiter is not None:
+    storage_client = getattr(getattr(limiter, "_storage", None), "storage", None)
+    if isinstance(storage_client, redis.Redis):
+        redis_client = storage_client
+
 F = TypeVar("F", bound=Callable[..., object])
 
 
 def limit(limit_value: str) -> Callable[[F], F]:
     """Return a limiter decorator when enabled, otherwise a no-op."""
 
+    # Parse once at decoration time so a malformed limit fails at import even when
+    # rate limiting is disabled. slowapi already pre-parses static route limits, so
+    # the string is passed through as-is (a callable would be re-parsed per request).
+    parse_many(limit_value)
+
     if not rate_limit_enabled or limiter is None:
 
         def decorator(func: F) -> F:
@@ -2,25 +2,38 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Index, Integer, Text, UniqueConstraint, func
+from sqlalchemy import DateTime, Index, Integer, Text, UniqueConstraint, func, text
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
 
 
+def _count_summary_words(context: DefaultExecutionContext) -> int:
+    """Count summary words once at insert time so reads don't re-tokenize."""
+
+    summary = context.get_current_parameters().get("summary") or ""
+    return len(summary.split())
+
+
 class Summary(Base):
     """Stored summary for a Wikipedia URL."""
 
     __tablename__ = "summaries"
     __table_args__ = (
         UniqueConstraint("url", "word_count", name="uq_summaries_url_word_count"),
-        Index("ix_summaries_url", "url"),
+        Index("ix_summaries_url_id", "url", text("id DESC")),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     url: Mapped[str] = mapped_column(Text, nullable=False)
     word_count: Mapped[int] = mapped_column(Integer, nullable=False)
     summary: Mapped[str] = mapped_column(Text, nullable=False)
+    actual_word_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=_count_summary_words,
+    )
     summary_origin: Mapped[str] = mapped_column(
         Text,
         nullable=False,
@@ -14,13 +14,22 @@ def _build_engine() -> Engine:
     database_url = settings.database_url
 
     connect_args: dict[str, object] = {}
+    pool_options: dict[str, object] = {}
     if database_url.startswith("sqlite"):
         connect_args["check_same_thread"] = False
+    else:
+        pool_options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_recycle": settings.db_pool_recycle_seconds,
+            "pool_timeout": settings.db_pool_timeout_seconds,
+        }
 
     return create_engine(
         database_url,
         pool_pre_ping=True,
         connect_args=connect_args,
+        **pool_options,
     )
 
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
 
@@ -8,9 +10,20 @@ from app.core.config import get_settings
 
 def build_llm(model: str | None = None) -> ChatOpenAI:
     settings = get_settings()
+    return _cached_llm(
+        model or settings.openai_model,
+        settings.openai_api_key,
+        settings.llm_timeout_seconds,
+    )
+
+
+# One client per configuration so its HTTP connection pool (and keep-alive) is reused
+# across calls; keyed on the settings it reads so a settings reload gets a fresh client.
+@lru_cache(maxsize=8)
+def _cached_llm(model: str, api_key: str, timeout: float) -> ChatOpenAI:
     return ChatOpenAI(
-        model=model or settings.openai_model,
+        model=model,
         temperature=0,
-        api_key=SecretStr(settings.openai_api_key),
-        timeout=settings.llm_timeout_seconds,
+        api_key=SecretStr(api_key),
+        timeout=timeout,
     )
@@ -1,7 +1,9 @@
 ﻿from __future__ import annotations
 
-from uuid import uuid4
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from fastapi import FastAPI, Request, Response
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -9,43 +11,32 @@ from slowapi.middleware import SlowAPIMiddleware
 
 from app.api.routes.health import router as health_router
 from app.api.routes.summaries import router as summaries_router
-from app.core.logging import configure_logging, reset_request_id, set_request_id
+from app.core.config import get_settings
+from app.core.logging import configure_logging
+from app.core.middleware import RequestEnvelopeMiddleware
 from app.core.ratelimit import limiter, rate_limit_enabled
+from app.services import wikipedia
 
 configure_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Sync routes block a worker thread for the whole scrape + LLM chain, so the
+    # threadpool size bounds how many summaries can be generated concurrently.
+    to_thread.current_default_thread_limiter().total_tokens = get_settings().threadpool_max_workers
+    yield
+    wikipedia.close_client()
+
+
 app = FastAPI(
     title="Wikipedia Summarizer API",
     description="API that scrapes Wikipedia articles, summarizes them with an LLM, and caches results in Postgres.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next) -> Response:
-    response = await call_next(request)
-    content_type = response.headers.get("content-type", "")
-    if content_type.startswith("application/json") and "charset=" not in content_type.lower():
-        response.headers["Content-Type"] = f"{content_type}; charset=utf-8"
-    response.headers.setdefault("Cache-Control", "no-store")
-    response.headers.setdefault("Pragma", "no-cache")
-    response.headers.setdefault("X-Content-Type-Options", "nosniff")
-    response.headers.setdefault("X-Frame-Options", "DENY")
-    response.headers.setdefault("Referrer-Policy", "no-referrer")
-    return response
-
-
-@app.middleware("http")
-async def add_request_context(request: Request, call_next) -> Response:
-    request_id = request.headers.get("x-request-id") or uuid4().hex
-    token = set_request_id(request_id)
-    try:
-        response = await call_next(request)
-    finally:
-        reset_request_id(token)
-    response.headers["X-Request-ID"] = request_id
-    return response
-
+app.add_middleware(RequestEnvelopeMiddleware)
 
 if rate_limit_enabled:
     app.state.limiter = limiter
@@ -1,6 +1,9 @@
 ﻿from __future__ import annotations
 
-from sqlalchemy import desc, select
+from functools import lru_cache
+
+from sqlalchemy import Insert, bindparam, desc, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -37,6 +40,37 @@ def update_summary_pt(
     return summary_obj
 
 
+_INSERT_COLUMNS: tuple[str, ...] = (
+    "url",
+    "summary",
+    "summary_pt",
+    "word_count",
+    "summary_origin",
+    "summary_pt_origin",
+)
+
+
+@lru_cache(maxsize=None)
+def _insert_ignoring_duplicates(dialect: str) -> Insert | None:
+    """Build INSERT ... ON CONFLICT DO NOTHING RETURNING once per dialect.
+
+    Values are bind parameters, so one statement object (and its compiled SQL) is
+    reused and the driver can keep a server-side prepared statement for it.
+    """
+
+    if dialect == "postgresql":
+        statement = postgresql.insert(Summary)
+    elif dialect == "sqlite":
+        statement = sqlite.insert(Summary)
+    else:
+        return None
+    return (
+        statement.values({column: bindparam(column) for column in _INSERT_COLUMNS})
+        .on_conflict_do_nothing(index_elements=["url", "word_count"])
+        .returning(Summary)
+    )
+
+
 def create_summary(
     session: Session,
     url: str,
@@ -51,14 +85,28 @@ def create_summary(
     Returns a tuple of (summary, created_new).
     """
 
-    summary = Summary(
-        url=url,
-        summary=summary_text,
-        summary_pt=summary_pt,
-        word_count=word_count,
-        summary_origin=summary_origin,
-        summary_pt_origin=summary_pt_origin,
-    )
+    values: dict[str, object] = {
+        "url": url,
+        "summary": summary_text,
+        "summary_pt": summary_pt,
+        "word_count": word_count,
+        "summary_origin": summary_origin,
+        "summary_pt_origin": summary_pt_origin,
+    }
+
+    statement = _insert_ignoring_duplicates(session.get_bind().dialect.name)
+    if statement is not None:
+        # One round-trip on the common path; a duplicate no-ops instead of aborting.
+        created = session.scalars(statement, values).first()
+        session.commit()
+        if created is not None:
+            return created, True
+        existing = get_by_url_and_word_count(session, url, word_count)
+        if existing is None:
+            raise RuntimeError("Summary insert conflicted but no existing row was found.")
+        return existing, False
+
+    summary = Summary(**values)
     session.add(summary)
 
     try:
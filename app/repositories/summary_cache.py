@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from datetime import datetime
+from typing import cast
+
+import orjson
+from sqlalchemy.orm import Session
+
+from app.core import ratelimit
+from app.core.config import get_settings
+from app.db.models import Summary
+from app.repositories import summaries as summaries_repo
+
+logger = logging.getLogger(__name__)
+
+_CACHED_FIELDS: tuple[str, ...] = (
+    "id",
+    "url",
+    "word_count",
+    "actual_word_count",
+    "summary",
+    "summary_origin",
+    "summary_pt",
+    "summary_pt_origin",
+)
+
+
+def _cache_key(url: str, word_count: int) -> str:
+    return f"summary:{hashlib.sha1(url.encode('utf-8')).hexdigest()}:{word_count}"
+
+
+def _serialize(summary: Summary) -> bytes:
+    payload: dict[str, object] = {field: getattr(summary, field) for field in _CACHED_FIELDS}
+    payload["created_at"] = summary.created_at.isoformat()
+    return orjson.dumps(payload)
+
+
+def _deserialize(raw: bytes) -> Summary:
+    payload = orjson.loads(raw)
+    payload["created_at"] = datetime.fromisoformat(payload["created_at"])
+    # Transient instance: callers only read attributes, it is never added to a session.
+    return Summary(**payload)
+
+
+def store(summary: Summary) -> None:
+    """Write a persisted summary to the Redis cache (best-effort)."""
+
+    client = ratelimit.redis_client
+    ttl = get_settings().summary_cache_ttl_seconds
+    if client is None or ttl <= 0:
+        return
+
+    try:
+        client.set(_cache_key(summary.url, summary.word_count), _serialize(summary), ex=ttl)
+    except Exception:
+        logger.warning("Failed to write summary to Redis cache.", exc_info=True)
+
+
+def get_by_url_and_word_count(session: Session, url: str, word_count: int) -> Summary | None:
+    """Cache-aside lookup in Redis before falling back to Postgres."""
+
+    client = ratelimit.redis_client
+    if client is None or get_settings().summary_cache_ttl_seconds <= 0:
+        return summaries_repo.get_by_url_and_word_count(session, url, word_count)
+
+    try:
+        # The client is synchronous, so get() returns the stored bytes (or None).
+        raw = cast(bytes | None, client.get(_cache_key(url, word_count)))
+    except Exception:
+        logger.warning("Failed to read summary from Redis cache.", exc_info=True)
+        raw = None
+    if raw is not None:
+        try:
+            return _deserialize(raw)
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+            logger.warning("Discarding malformed summary cache entry.", exc_info=True)
+
+    summary = summaries_repo.get_by_url_and_word_count(session, url, word_count)
+    if summary is not None:
+        store(summary)
+    return summary
@@ -7,12 +7,8 @@ from sqlalchemy.orm import Session
 
 from app.db.models import Summary
 from app.repositories import summaries as summaries_repo
-from app.services.summarizer import (
-    TRANSLATION_ORIGIN_ERROR,
-    SummarizationError,
-    summarize_text,
-    translate_summary_to_portuguese,
-)
+from app.repositories import summary_cache
+from app.services.summarizer import SummarizationError, summarize_and_translate
 from app.services.wikipedia import (
     ScrapingError,
     URLValidationError,
@@ -56,22 +52,22 @@ class SummaryOrchestrator:
         if word_count is None:
             return summaries_repo.get_latest_by_url(self.session, normalized)
 
-        return summaries_repo.get_by_url_and_word_count(
-            self.session, normalized, word_count
-        )
+        return summary_cache.get_by_url_and_word_count(self.session, normalized, word_count)
 
     def get_or_create_summary(self, url: str, word_count: int) -> tuple[Summary, SourceLiteral]:
         """Get existing summary or generate a new one."""
         normalized_url = self._normalize_url(url)
 
         # 1. Check Cache
-        existing = summaries_repo.get_by_url_and_word_count(
-            self.session, normalized_url, word_count
-        )
+        existing = summary_cache.get_by_url_and_word_count(self.session, normalized_url, word_count)
         if existing is not None:
             logger.info("Orchestrator: Returning cached summary for %s", normalized_url)
             return existing, "cache"
 
+        # End the read transaction so no pooled DB connection is held during the slow
+        # scrape and LLM steps; create_summary checks one out again for the insert.
+        self.session.rollback()
+
         # 2. Scrape Wikipedia
         try:
             article_text = get_wikipedia_article_text(normalized_url)
@@ -80,24 +76,15 @@ class SummaryOrchestrator:
         except ScrapingError as exc:
             raise UpstreamServiceError(f"Wikipedia scraping failed: {exc}") from exc
 
-        # 3. Summarize
+        # 3. Summarize and translate in one LLM round-trip (translation is best-effort).
         try:
-            summary_text, origin = summarize_text(article_text, word_count)
+            summary_text, origin, summary_pt, pt_origin = summarize_and_translate(
+                article_text, word_count
+            )
         except SummarizationError as exc:
             raise UpstreamServiceError(f"LLM processing failed: {exc}") from exc
 
-        # 4. Translate (best-effort)
-        try:
-            summary_pt, pt_origin = translate_summary_to_portuguese(summary_text, word_count)
-        except SummarizationError:
-            logger.warning(
-                "Portuguese translation failed; returning summary without translation.",
-                exc_info=True,
-            )
-            summary_pt = None
-            pt_origin = TRANSLATION_ORIGIN_ERROR
-
-        # 5. Save to Repo
+        # 4. Save to Repo
         summary_obj, created_new = summaries_repo.create_summary(
             self.session,
             url=normalized_url,
@@ -107,6 +94,7 @@ class SummaryOrchestrator:
             summary_origin=origin,
             summary_pt_origin=pt_origin,
         )
+        summary_cache.store(summary_obj)
 
         source: SourceLiteral = "generated" if created_new else "cache"
         logger.info("Orchestrator: %s summary for %s", source.capitalize(), normalized_url)
@@ -1,13 +1,18 @@
 ﻿from __future__ import annotations
 
+import contextvars
 import hashlib
 import json
 import logging
 import random
 import re
 import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Iterable, Mapping, Sequence
 
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from app.core.config import get_settings
@@ -17,72 +22,73 @@ from app.llm.prompt_loader import load_prompt
 logger = logging.getLogger(__name__)
 
 SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
-WHITESPACE_PATTERN = re.compile(r"\s+")
+SENTENCE_BOUNDARIES = (". ", "! ", "? ")
+SENTENCE_ENDINGS = (".", "!", "?")
+TRAILING_PUNCTUATION = " ,;:-"
+WORD_PATTERN = re.compile(r"\S+")
 JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
-PLACEHOLDER_API_KEYS = {"your-openai-api-key"}
 PORTUGUESE_WORD_RE = re.compile(r"[a-záàâãéêíóôõúç]+", re.IGNORECASE)
-PORTUGUESE_STOPWORDS = {
-    "a",
-    "o",
-    "os",
-    "as",
-    "um",
-    "uma",
-    "uns",
-    "umas",
-    "de",
-    "do",
-    "da",
-    "dos",
-    "das",
-    "em",
-    "no",
-    "na",
-    "nos",
-    "nas",
-    "por",
-    "para",
-    "com",
-    "e",
-    "que",
-    "como",
-    "ou",
-    "não",
-    "mais",
-    "menos",
-    "já",
-    "há",
-    "se",
-    "sua",
-    "seu",
-    "suas",
-    "seus",
-    "entre",
-    "ao",
-    "à",
-    "às",
-    "aos",
-    "sobre",
-    "também",
-    "foi",
-    "era",
-    "ser",
-    "são",
-    "está",
-    "estão",
-    "tem",
-    "têm",
-    "pelo",
-    "pela",
-    "pelos",
-    "pelas",
-}
-PORTUGUESE_STRONG_STOPWORDS = {word for word in PORTUGUESE_STOPWORDS if len(word) >= 2}
+# Only words of two or more letters: single letters are too ambiguous across languages.
+PORTUGUESE_STRONG_STOPWORDS: frozenset[str] = frozenset(
+    {
+        "os",
+        "as",
+        "um",
+        "uma",
+        "uns",
+        "umas",
+        "de",
+        "do",
+        "da",
+        "dos",
+        "das",
+        "em",
+        "no",
+        "na",
+        "nos",
+        "nas",
+        "por",
+        "para",
+        "com",
+        "que",
+        "como",
+        "ou",
+        "não",
+        "mais",
+        "menos",
+        "já",
+        "há",
+        "se",
+        "sua",
+        "seu",
+        "suas",
+        "seus",
+        "entre",
+        "ao",
+        "às",
+        "aos",
+        "sobre",
+        "também",
+        "foi",
+        "era",
+        "ser",
+        "são",
+        "está",
+        "estão",
+        "tem",
+        "têm",
+        "pelo",
+        "pela",
+        "pelos",
+        "pelas",
+    }
+)
 
 MAP_REDUCE_THRESHOLD_WORDS = 1200
 MAP_CHUNK_WORDS = 800
 MAP_MIN_SUMMARY_WORDS = 60
 MAP_MAX_SUMMARY_WORDS = 200
+FALLBACK_SUMMARY_SENTENCES = 5
 
 SUMMARY_ORIGIN_LLM = "llm"
 SUMMARY_ORIGIN_LLM_FALLBACK = "llm_fallback"
@@ -100,15 +106,15 @@ class SummarizationError(RuntimeError):
 
 
 def _llm_available() -> bool:
-    settings = get_settings()
-    key = settings.openai_api_key.strip()
-    return bool(key) and key not in PLACEHOLDER_API_KEYS
+    # Computed once per Settings instance; get_settings.cache_clear() resets it.
+    return get_settings().llm_available
 
 
 def _normalize_whitespace(text: str) -> str:
     """Collapse repeated whitespace for cleaner outputs."""
 
-    return WHITESPACE_PATTERN.sub(" ", text).strip()
+    # str.split() uses the same whitespace set as `\s` and is much faster than re.sub.
+    return " ".join(text.split())
 
 
 def _strip_code_fences(text: str) -> str:
@@ -123,26 +129,29 @@ def _strip_code_fences(text: str) -> str:
 def _try_parse_json(text: str) -> dict[str, Any] | None:
     cleaned = _strip_code_fences(text)
     try:
-        data = json.loads(cleaned)
+        data = orjson.loads(cleaned)
         if isinstance(data, dict):
             return data
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         pass
 
     match = JSON_OBJECT_PATTERN.search(cleaned)
     if not match:
         return None
     try:
-        data = json.loads(match.group(0))
+        data = orjson.loads(match.group(0))
         if isinstance(data, dict):
             return data
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return None
     return None
 
 
 def _extract_json_field(text: str, field: str) -> str | None:
-    data = _try_parse_json(text)
+    return _json_text_field(_try_parse_json(text), field)
+
+
+def _json_text_field(data: Mapping[str, Any] | None, field: str) -> str | None:
     if not data:
         return None
     value = data.get(field)
@@ -151,11 +160,33 @@ def _extract_json_field(text: str, field: str) -> str | None:
     return None
 
 
-def _format_instructions(field: str) -> str:
-    example = json.dumps({field: "..."}, ensure_ascii=False)
-    return f'Return only JSON with a single key "{field}". Example: {example}.'
+def _format_instructions(*fields: str) -> str:
+    example = json.dumps(dict.fromkeys(fields, "..."), ensure_ascii=False)
+    if len(fields) == 1:
+        return f'Return only JSON with a single key "{fields[0]}". Example: {example}.'
+    keys = " and ".join(f'"{field}"' for field in fields)
+    return f"Return only JSON with the keys {keys}. Example: {example}."
+
+
+SUMMARY_FORMAT_INSTRUCTIONS = _format_instructions("summary")
+TRANSLATION_FORMAT_INSTRUCTIONS = _format_instructions("translation")
+SUMMARY_TRANSLATION_FORMAT_INSTRUCTIONS = _format_instructions("summary", "translation")
 
+# Prompt files are static, so load them once at import instead of per LLM call.
+SUMMARY_SYSTEM_PROMPT = load_prompt("summary_system.md")
+SUMMARY_HUMAN_PROMPT = load_prompt("summary_human.md")
+SUMMARY_MAP_HUMAN_PROMPT = load_prompt("summary_map_human.md")
+SUMMARY_REDUCE_HUMAN_PROMPT = load_prompt("summary_reduce_human.md")
+TRANSLATION_SYSTEM_PROMPT = load_prompt("translation_system.md")
+TRANSLATION_HUMAN_PROMPT = load_prompt("translation_human.md")
+SUMMARY_TRANSLATION_SYSTEM_PROMPT = load_prompt("summary_translation_system.md")
+SUMMARY_TRANSLATION_HUMAN_PROMPT = load_prompt("summary_translation_human.md")
+SUMMARY_TRANSLATION_REDUCE_HUMAN_PROMPT = load_prompt("summary_translation_reduce_human.md")
 
+
+# Prompts are module constants, so str hashes are cached and lookups stay cheap.
+# SHA-256 therefore runs once per prompt set; it is kept so logged tags stay stable.
+@lru_cache(maxsize=32)
 def _prompt_version(system_prompt: str, human_prompt: str, format_instructions: str) -> str:
     payload = "\n".join([system_prompt, human_prompt, format_instructions])
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:8]
@@ -169,11 +200,13 @@ def _looks_like_portuguese(text: str) -> bool:
         return False
 
     words = PORTUGUESE_WORD_RE.findall(cleaned)
-    if len(words) < 5:
+    word_total = len(words)
+    if word_total < 5:
         return False
 
-    stopword_hits = sum(1 for word in words if word in PORTUGUESE_STRONG_STOPWORDS)
-    stopword_ratio = stopword_hits / max(1, len(words))
+    # One tokenizing pass; membership is counted in C via map() over the frozenset.
+    stopword_hits = sum(map(PORTUGUESE_STRONG_STOPWORDS.__contains__, words))
+    stopword_ratio = stopword_hits / word_total
 
     # Be conservative: only skip translation when we have enough Portuguese stopwords.
     return stopword_hits >= 3 and stopword_ratio >= 0.08
@@ -189,59 +222,58 @@ def _content_to_text(content: Any) -> str:
         return _normalize_whitespace(content)
 
     if isinstance(content, Sequence):
+        # Collect raw fragments and normalize once; blank fragments collapse away.
         parts: list[str] = []
         for item in content:
             if isinstance(item, str):
-                text = _normalize_whitespace(item)
-                if text:
-                    parts.append(text)
+                parts.append(item)
                 continue
             if isinstance(item, Mapping):
                 for key in ("text", "content"):
                     value = item.get(key)
                     if isinstance(value, str):
-                        text = _normalize_whitespace(value)
-                        if text:
-                            parts.append(text)
+                        parts.append(value)
                         break
         return _normalize_whitespace(" ".join(parts))
 
     return _normalize_whitespace(str(content))
 
 
+@lru_cache(maxsize=32)
+def _leading_words_pattern(max_words: int) -> re.Pattern[str]:
+    """Match up to max_words words in one regex scan instead of splitting every word."""
+
+    return re.compile(rf"\S+(?:\s+\S+){{0,{max(0, max_words - 1)}}}")
+
+
 def _truncate_to_word_limit(text: str, max_words: int) -> str:
     """Trim text to at most max_words, preferring sentence boundaries."""
 
-    words = text.split()
-    if len(words) <= max_words:
+    leading = _leading_words_pattern(max_words).search(text)
+    if leading is None or WORD_PATTERN.search(text, leading.end()) is None:
         return text.strip()
 
-    truncated_words = words[:max_words]
-    truncated_text = " ".join(truncated_words).strip()
+    truncated_text = _normalize_whitespace(leading.group(0))
 
-    sentences = SENTENCE_SPLIT_PATTERN.split(truncated_text)
-    if len(sentences) > 1:
-        candidate = " ".join(sentences[:-1]).strip()
-        if candidate and len(candidate.split()) >= max(1, int(max_words * 0.6)):
+    # The text is whitespace-normalized, so the last sentence boundary is the last
+    # ". ", "! " or "? "; slicing there avoids splitting and re-joining sentences.
+    boundary = max(truncated_text.rfind(end) for end in SENTENCE_BOUNDARIES)
+    if boundary >= 0:
+        candidate = truncated_text[: boundary + 1]
+        if candidate.count(" ") + 1 >= max(1, int(max_words * 0.6)):
             truncated_text = candidate
 
-    truncated_text = truncated_text.rstrip(" ,;:-")
-    if not truncated_text.endswith((".", "!", "?")):
+    truncated_text = truncated_text.rstrip(TRAILING_PUNCTUATION)
+    if not truncated_text.endswith(SENTENCE_ENDINGS):
         truncated_text = f"{truncated_text}."
 
     return truncated_text
 
 
 def _split_text_into_chunks(text: str, max_words: int) -> list[str]:
-    words = text.split()
-    if not words:
-        return []
-    chunks: list[str] = []
-    for idx in range(0, len(words), max_words):
-        chunk_words = words[idx : idx + max_words]
-        if chunk_words:
-            chunks.append(" ".join(chunk_words))
-    return chunks
+    """Split whitespace-normalized text into chunks of at most max_words words."""
+
+    return [match.group(0) for match in _leading_words_pattern(max_words).finditer(text)]
 
 
 def _map_chunk_word_target(final_word_count: int, chunk_count: int) -> int:
@@ -255,15 +287,20 @@ def _map_chunk_word_target(final_word_count: int, chunk_count: int) -> int:
 def _fallback_summary(text: str, word_count: int) -> str:
     """Generate a simple extractive summary without the LLM."""
 
-    cleaned = _normalize_whitespace(text)
-    if not cleaned:
+    # The result never exceeds word_count words, so only the leading word_count + 1 words
+    # (the extra one tells the truncation that more text follows) are normalized and
+    # scanned, not the whole article.
+    leading = _leading_words_pattern(word_count + 1).search(text)
+    if leading is None:
         raise SummarizationError("No content available to summarize.")
+    cleaned = _normalize_whitespace(leading.group(0))
 
-    sentences = SENTENCE_SPLIT_PATTERN.split(cleaned)
-    if sentences:
-        candidate = " ".join(sentences[: min(len(sentences), 5)])
-    else:
-        candidate = cleaned
+    # Stop at the boundary after the last kept sentence instead of splitting the text.
+    boundary = next(
+        islice(SENTENCE_SPLIT_PATTERN.finditer(cleaned), FALLBACK_SUMMARY_SENTENCES - 1, None),
+        None,
+    )
+    candidate = cleaned if boundary is None else cleaned[: boundary.start()]
 
     return _truncate_to_word_limit(candidate, word_count)
 
@@ -273,13 +310,8 @@ def _build_llm(model: str | None = None):
 
 
 def _get_fallback_model() -> str | None:
-    settings = get_settings()
-    fallback = settings.openai_fallback_model.strip()
-    if not fallback:
-        return None
-    if fallback == settings.openai_model:
-        return None
-    return fallback
+    # Computed once per Settings instance, like _llm_available.
+    return get_settings().fallback_model
 
 
 def _build_summary_messages(
@@ -291,11 +323,11 @@ def _build_summary_messages(
     chunk_index: int | None = None,
     total_chunks: int | None = None,
 ) -> tuple[list[SystemMessage | HumanMessage], str]:
-    system_prompt = load_prompt("summary_system.md")
-    format_instructions = _format_instructions("summary")
+    system_prompt = SUMMARY_SYSTEM_PROMPT
+    format_instructions = SUMMARY_FORMAT_INSTRUCTIONS
 
     if mode == "map":
-        human_template = load_prompt("summary_map_human.md")
+        human_template = SUMMARY_MAP_HUMAN_PROMPT
         human_prompt = human_template.format(
             word_count=word_count,
             text=text or "",
@@ -304,14 +336,14 @@ def _build_summary_messages(
             format_instructions=format_instructions,
         )
     elif mode == "reduce":
-        human_template = load_prompt("summary_reduce_human.md")
+        human_template = SUMMARY_REDUCE_HUMAN_PROMPT
         human_prompt = human_template.format(
             word_count=word_count,
             summaries=summaries or "",
             format_instructions=format_instructions,
         )
     else:
-        human_template = load_prompt("summary_human.md")
+        human_template = SUMMARY_HUMAN_PROMPT
         human_prompt = human_template.format(
             word_count=word_count,
             text=text or "",
@@ -331,9 +363,9 @@ def _build_translation_messages(
     summary: str,
     word_count: int,
 ) -> tuple[list[SystemMessage | HumanMessage], str]:
-    system_prompt = load_prompt("translation_system.md")
-    human_template = load_prompt("translation_human.md")
-    format_instructions = _format_instructions("translation")
+    system_prompt = TRANSLATION_SYSTEM_PROMPT
+    human_template = TRANSLATION_HUMAN_PROMPT
+    format_instructions = TRANSLATION_FORMAT_INSTRUCTIONS
     human_prompt = human_template.format(
         word_count=word_count,
         summary=summary,
@@ -347,6 +379,36 @@ def _build_translation_messages(
     return messages, prompt_version
 
 
+def _build_summary_translation_messages(
+    *,
+    text: str | None,
+    summaries: str | None,
+    word_count: int,
+) -> tuple[list[SystemMessage | HumanMessage], str]:
+    system_prompt = SUMMARY_TRANSLATION_SYSTEM_PROMPT
+    format_instructions = SUMMARY_TRANSLATION_FORMAT_INSTRUCTIONS
+    if summaries is not None:
+        human_template = SUMMARY_TRANSLATION_REDUCE_HUMAN_PROMPT
+        human_prompt = human_template.format(
+            word_count=word_count,
+            summaries=summaries,
+            format_instructions=format_instructions,
+        )
+    else:
+        human_template = SUMMARY_TRANSLATION_HUMAN_PROMPT
+        human_prompt = human_template.format(
+            word_count=word_count,
+            text=text or "",
+            format_instructions=format_instructions,
+        )
+    prompt_version = _prompt_version(system_prompt, human_template, format_instructions)
+    messages: list[SystemMessage | HumanMessage] = [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=human_prompt),
+    ]
+    return messages, prompt_version
+
+
 def _extract_structured_text(raw_text: str, field: str, *, purpose: str) -> str:
     extracted = _extract_json_field(raw_text, field)
     if extracted is not None:
@@ -468,24 +530,20 @@ def _summarize_single_pass(text: str, word_count: int) -> tuple[str, str]:
     return _truncate_to_word_limit(summary, word_count), origin
 
 
-def _summarize_map_reduce(text: str, word_count: int) -> tuple[str, str]:
-    cleaned = _normalize_whitespace(text)
-    chunks = _split_text_into_chunks(cleaned, MAP_CHUNK_WORDS)
-    if len(chunks) <= 1:
-        return _summarize_single_pass(cleaned, word_count)
+def _summarize_chunks(chunks: list[str], word_count: int) -> tuple[list[str], list[str]]:
+    """Run the map step: summarize each chunk, returning partials and their origins."""
 
     chunk_target = _map_chunk_word_target(word_count, len(chunks))
-    partials: list[str] = []
-    origins: list[str] = []
+    total_chunks = len(chunks)
 
-    for idx, chunk in enumerate(chunks, start=1):
+    def summarize_chunk(idx: int, chunk: str) -> tuple[str, str]:
         messages, prompt_version = _build_summary_messages(
             text=chunk,
             summaries=None,
             word_count=chunk_target,
             mode="map",
             chunk_index=idx,
-            total_chunks=len(chunks),
+            total_chunks=total_chunks,
         )
         raw_summary, origin = _invoke_with_fallback(
             messages,
@@ -495,8 +553,51 @@ def _summarize_map_reduce(text: str, word_count: int) -> tuple[str, str]:
             prompt_version=prompt_version,
         )
         summary = _extract_structured_text(raw_summary, "summary", purpose="summary-map")
-        partials.append(_truncate_to_word_limit(summary, chunk_target))
-        origins.append(origin)
+        return _truncate_to_word_limit(summary, chunk_target), origin
+
+    # Map calls are independent network round-trips, so run them concurrently (bounded).
+    max_workers = max(1, min(get_settings().llm_max_parallel_chunks, total_chunks))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            # Copy the context per task so request-scoped log fields follow the call.
+            executor.submit(contextvars.copy_context().run, summarize_chunk, idx, chunk)
+            for idx, chunk in enumerate(chunks, start=1)
+        ]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in done:
+            if future.exception() is not None:
+                future.result()
+        results = [future.result() for future in futures]
+    finally:
+        # On failure, drop queued chunks instead of waiting out their calls and retries.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    partials = [partial_summary for partial_summary, _ in results]
+    origins = [origin for _, origin in results]
+    return partials, origins
+
+
+def _combine_origins(step_origins: Iterable[str]) -> str:
+    if any(step_origin == SUMMARY_ORIGIN_LLM_FALLBACK for step_origin in step_origins):
+        return SUMMARY_ORIGIN_LLM_FALLBACK
+    return SUMMARY_ORIGIN_LLM
+
+
+def _map_reduce_chunks(cleaned: str) -> list[str] | None:
+    """Return the map chunks when the text needs map-reduce, or None for a single call."""
+
+    # Only the leading threshold words are matched; the text is whitespace-normalized,
+    # so spaces + 1 counts them without splitting the whole article.
+    leading = _leading_words_pattern(MAP_REDUCE_THRESHOLD_WORDS).search(cleaned)
+    if leading is None or leading.group(0).count(" ") + 1 < MAP_REDUCE_THRESHOLD_WORDS:
+        return None
+    chunks = _split_text_into_chunks(cleaned, MAP_CHUNK_WORDS)
+    return chunks if len(chunks) > 1 else None
+
+
+def _summarize_map_reduce(chunks: list[str], word_count: int) -> tuple[str, str]:
+    partials, origins = _summarize_chunks(chunks, word_count)
 
     combined = "\n\n".join(partials)
     messages, prompt_version = _build_summary_messages(
@@ -513,12 +614,7 @@ def _summarize_map_reduce(text: str, word_count: int) -> tuple[str, str]:
         prompt_version=prompt_version,
     )
     summary = _extract_structured_text(raw_summary, "summary", purpose="summary-reduce")
-
-    if any(step_origin == SUMMARY_ORIGIN_LLM_FALLBACK for step_origin in origins + [origin]):
-        final_origin = SUMMARY_ORIGIN_LLM_FALLBACK
-    else:
-        final_origin = SUMMARY_ORIGIN_LLM
-
+    final_origin = _combine_origins([*origins, origin])
     return _truncate_to_word_limit(summary, word_count), final_origin
 
 
@@ -531,8 +627,9 @@ def summarize_text(text: str, word_count: int) -> tuple[str, str]:
 
     try:
         cleaned = _normalize_whitespace(text)
-        if len(cleaned.split()) >= MAP_REDUCE_THRESHOLD_WORDS:
-            summary, origin = _summarize_map_reduce(cleaned, word_count)
+        chunks = _map_reduce_chunks(cleaned)
+        if chunks is not None:
+            summary, origin = _summarize_map_reduce(chunks, word_count)
         else:
             summary, origin = _summarize_single_pass(cleaned, word_count)
     except SummarizationError:
@@ -575,3 +672,83 @@ def translate_summary_to_portuguese(summary_en: str, word_count: int) -> tuple[s
         raise SummarizationError("Failed to translate summary with the LLM.") from exc
     translated = _extract_structured_text(raw_translation, "translation", purpose="translation")
     return _truncate_to_word_limit(translated, word_count), origin
+
+
+def _translate_best_effort(summary: str, word_count: int) -> tuple[str | None, str]:
+    try:
+        return translate_summary_to_portuguese(summary, word_count)
+    except SummarizationError:
+        logger.warning(
+            "Portuguese translation failed; returning summary without translation.",
+            exc_info=True,
+        )
+        return None, TRANSLATION_ORIGIN_ERROR
+
+
+def summarize_and_translate(text: str, word_count: int) -> tuple[str, str, str | None, str]:
+    """Summarize text and translate the summary to Portuguese in a single LLM call.
+
+    Returns (summary, summary_origin, summary_pt, summary_pt_origin). Translation is
+    best-effort: when it cannot be produced the summary is still returned.
+    """
+
+    settings = get_settings()
+    if not settings.enable_portuguese_translation or not _llm_available():
+        summary, origin = summarize_text(text, word_count)
+        summary_pt, pt_origin = _translate_best_effort(summary, word_count)
+        return summary, origin, summary_pt, pt_origin
+
+    try:
+        cleaned = _normalize_whitespace(text)
+        step_origins: list[str] = []
+        summaries: str | None = None
+        chunks = _map_reduce_chunks(cleaned)
+        if chunks is not None:
+            partials, step_origins = _summarize_chunks(chunks, word_count)
+            summaries = "\n\n".join(partials)
+
+        messages, prompt_version = _build_summary_translation_messages(
+            text=cleaned,
+            summaries=summaries,
+            word_count=word_count,
+        )
+        raw_output, origin = _invoke_with_fallback(
+            messages,
+            primary_origin=SUMMARY_ORIGIN_LLM,
+            fallback_origin=SUMMARY_ORIGIN_LLM_FALLBACK,
+            purpose="summary-translation",
+            prompt_version=prompt_version,
+        )
+    except SummarizationError:
+        logger.exception("LLM summarization failed; using fallback summarizer.")
+        summary = _fallback_summary(text, word_count)
+        summary_pt, pt_origin = _translate_best_effort(summary, word_count)
+        return summary, SUMMARY_ORIGIN_FALLBACK, summary_pt, pt_origin
+
+    data = _try_parse_json(raw_output)
+    summary = _json_text_field(data, "summary")
+    if summary is None:
+        logger.warning(
+            "LLM output missing JSON field 'summary' (purpose=summary-translation); "
+            "using raw text."
+        )
+        summary = _normalize_whitespace(raw_output)
+    summary = _truncate_to_word_limit(summary, word_count)
+    summary_origin = _combine_origins([*step_origins, origin])
+
+    if _looks_like_portuguese(summary):
+        # Preserve the original text so the API keeps a consistent summary payload.
+        return summary, summary_origin, summary, TRANSLATION_ORIGIN_SKIPPED
+
+    translated = _json_text_field(data, "translation")
+    if translated is None:
+        logger.warning("LLM output missing the translation; translating separately.")
+        summary_pt, pt_origin = _translate_best_effort(summary, word_count)
+        return summary, summary_origin, summary_pt, pt_origin
+
+    pt_origin = (
+        TRANSLATION_ORIGIN_LLM_FALLBACK
+        if origin == SUMMARY_ORIGIN_LLM_FALLBACK
+        else TRANSLATION_ORIGIN_LLM
+    )
+    return summary, summary_origin, _truncate_to_word_limit(translated, word_count), pt_origin
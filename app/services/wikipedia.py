@@ -1,10 +1,15 @@
 ﻿from __future__ import annotations
 
+import codecs
+import importlib.util
 import logging
 import re
+import threading
+from functools import lru_cache
 from urllib.parse import SplitResult, parse_qs, quote, urljoin, urlsplit, urlunsplit
 
 import httpx
+import soupsieve
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
@@ -12,8 +17,9 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# lxml (libxml2) parses large pages several times faster than the pure-Python parser.
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
 REFERENCE_PATTERN = re.compile(r"\[\d+\]")
-WHITESPACE_PATTERN = re.compile(r"\s+")
 REMOVAL_SELECTORS: tuple[str, ...] = (
     "table.infobox",
     "table.navbox",
@@ -27,6 +33,13 @@ REMOVAL_SELECTORS: tuple[str, ...] = (
     "style",
     "script",
 )
+# Selectors are compiled once at import. The removal list is a single selector list so
+# the content subtree is walked once instead of once per selector.
+CONTENT_MATCHER = soupsieve.compile("div#mw-content-text div.mw-parser-output")
+REMOVAL_MATCHER = soupsieve.compile(", ".join(REMOVAL_SELECTORS))
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
 
 
 class URLValidationError(ValueError):
@@ -53,6 +66,9 @@ def _validate_parsed_url(parsed: SplitResult) -> None:
         raise URLValidationError("URL must belong to wikipedia.org.")
 
 
+# The orchestrator and the scraper both normalize the same URL; lru_cache only caches
+# returned values, so invalid URLs still raise URLValidationError on every call.
+@lru_cache(maxsize=4096)
 def normalize_wikipedia_url(url: str) -> str:
     """Validate and normalize a Wikipedia URL to reduce obvious duplicates."""
 
@@ -101,63 +117,95 @@ def normalize_wikipedia_url(url: str) -> str:
 def _clean_text(text: str) -> str:
     """Remove reference markers and collapse whitespace."""
 
-    text = REFERENCE_PATTERN.sub("", text)
-    text = WHITESPACE_PATTERN.sub(" ", text)
-    return text.strip()
+    # split()/join collapses and strips whitespace in one C-level pass, much faster than
+    # a regex sub (and than fusing both patterns behind a Python replacement callback).
+    return " ".join(REFERENCE_PATTERN.sub("", text).split())
+
 
+def _read_response_limited(response: httpx.Response, max_bytes: int) -> tuple[bytes, str]:
+    """Read response content with a hard size limit.
 
-def _read_response_limited(response: httpx.Response, max_bytes: int) -> str:
-    """Read response content with a hard size limit."""
+    Returns the raw body and its encoding; the parser decodes it, so no separate
+    decoded copy of the page is built.
+    """
 
     if max_bytes <= 0:
         raise ScrapingError("Invalid max content size configuration.")
 
-    content = bytearray()
+    chunks: list[bytes] = []
+    total = 0
     for chunk in response.iter_bytes():
-        content.extend(chunk)
-        if len(content) > max_bytes:
+        total += len(chunk)
+        if total > max_bytes:
             raise ScrapingError("Wikipedia content exceeded the maximum allowed size.")
+        chunks.append(chunk)
 
-    encoding = response.encoding or "utf-8"
-    return content.decode(encoding, errors="replace")
+    # Canonical codec name: libxml2 misreads some aliases (e.g. "latin-1").
+    return b"".join(chunks), codecs.lookup(response.encoding or "utf-8").name
 
 
-def _fetch_wikipedia_html(url: str) -> str:
-    """Fetch Wikipedia HTML with redirect validation and size limits."""
+def _get_client() -> httpx.Client:
+    """Return the process-wide Wikipedia client, building it on first use.
+
+    Sharing one client keeps TCP/TLS connections to Wikipedia alive across requests.
+    httpx already sends ``Accept-Encoding`` for every codec it can decode (gzip and
+    deflate, plus br/zstd when installed) and ``iter_bytes()`` yields decoded bytes, so
+    pages are transferred compressed while the size limit applies to the decoded HTML.
+    """
+
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                settings = get_settings()
+                _client = httpx.Client(
+                    timeout=httpx.Timeout(settings.http_timeout_seconds),
+                    follow_redirects=False,
+                    headers={"User-Agent": settings.wikipedia_user_agent},
+                )
+    return _client
 
-    settings = get_settings()
-    timeout = httpx.Timeout(settings.http_timeout_seconds)
 
-    headers = {
-        "User-Agent": settings.wikipedia_user_agent,
-    }
+def close_client() -> None:
+    """Close the shared Wikipedia client (called on application shutdown)."""
 
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def _fetch_wikipedia_html(url: str) -> tuple[bytes, str]:
+    """Fetch Wikipedia HTML with redirect validation and size limits."""
+
+    settings = get_settings()
     current_url = url
     max_redirects = settings.wikipedia_max_redirects
     if max_redirects < 0:
         raise ScrapingError("Invalid redirect configuration.")
 
-    with httpx.Client(timeout=timeout, follow_redirects=False, headers=headers) as client:
-        for _ in range(max_redirects + 1):
-            try:
-                with client.stream("GET", current_url) as response:
-                    if response.is_redirect:
-                        location = response.headers.get("Location")
-                        if not location:
-                            raise ScrapingError("Redirect response missing Location header.")
-
-                        next_url = urljoin(current_url, location)
-                        normalized = normalize_wikipedia_url(next_url)
-                        current_url = normalized
-                        continue
-
-                    response.raise_for_status()
-                    return _read_response_limited(response, settings.wikipedia_max_content_bytes)
-            except URLValidationError:
-                raise
-            except httpx.HTTPError as exc:
-                logger.exception("Failed to fetch Wikipedia URL: %s", current_url)
-                raise ScrapingError("Failed to fetch Wikipedia content.") from exc
+    client = _get_client()
+    for _ in range(max_redirects + 1):
+        try:
+            with client.stream("GET", current_url) as response:
+                if response.is_redirect:
+                    location = response.headers.get("Location")
+                    if not location:
+                        raise ScrapingError("Redirect response missing Location header.")
+
+                    next_url = urljoin(current_url, location)
+                    normalized = normalize_wikipedia_url(next_url)
+                    current_url = normalized
+                    continue
+
+                response.raise_for_status()
+                return _read_response_limited(response, settings.wikipedia_max_content_bytes)
+        except URLValidationError:
+            raise
+        except httpx.HTTPError as exc:
+            logger.exception("Failed to fetch Wikipedia URL: %s", current_url)
+            raise ScrapingError("Failed to fetch Wikipedia content.") from exc
 
     raise ScrapingError("Too many redirects when fetching Wikipedia content.")
 
@@ -166,24 +214,23 @@ def get_wikipedia_article_text(url: str) -> str:
     """Fetch and extract the main article text from a Wikipedia page."""
     settings = get_settings()
     normalized_url = normalize_wikipedia_url(url)
-    html = _fetch_wikipedia_html(normalized_url)
-    soup = BeautifulSoup(html, "html.parser")
+    html, encoding = _fetch_wikipedia_html(normalized_url)
+    soup = BeautifulSoup(html, HTML_PARSER, from_encoding=encoding)
 
-    content = soup.select_one("div#mw-content-text div.mw-parser-output")
+    content = CONTENT_MATCHER.select_one(soup)
     if not isinstance(content, Tag):
         content = soup.find("div", id="mw-content-text")
     if not isinstance(content, Tag):
         raise ScrapingError("Could not locate the main article content.")
 
-    for selector in REMOVAL_SELECTORS:
-        for element in content.select(selector):
+    for element in REMOVAL_MATCHER.select(content):
+        # Matches nested inside an already removed element are gone with it.
+        if not element.decomposed:
             element.decompose()
 
-    paragraphs = [
-        paragraph.get_text(" ", strip=True)
-        for paragraph in content.find_all("p")
-        if paragraph.get_text(" ", strip=True)
-    ]
+    # get_text walks every descendant, so call it once per paragraph.
+    texts = (paragraph.get_text(" ", strip=True) for paragraph in content.find_all("p"))
+    paragraphs = [text for text in texts if text]
 
     article_text = _clean_text(" ".join(paragraphs))
     article_word_count = len(article_text.split())
@@ -2,14 +2,26 @@
 
 import os
 import sys
+from collections.abc import Generator
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
 from app.core.config import get_settings  # noqa: E402
 
+# Importing the models registers their tables on Base.metadata for create_all.
+from app.db import models  # noqa: E402,F401
+from app.db.base import Base  # noqa: E402
+
 # Provide required environment variables for tests without hardcoded defaults in code.
 os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
 os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
@@ -34,3 +46,54 @@ os.environ.setdefault("RATE_LIMIT_GET_SUMMARIES", "1000/minute")
 
 # Ensure cached settings reflect the test environment.
 get_settings.cache_clear()
+
+
+@pytest.fixture()
+def fresh_settings() -> Generator[None, None, None]:
+    """Rebuild settings from the (monkeypatched) environment, and again after the test."""
+
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def db_engine() -> Generator[Engine, None, None]:
+    # The schema is built once per run; db_session_factory empties the tables per test.
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+@pytest.fixture()
+def db_session_factory(db_engine: Engine) -> Generator[sessionmaker[Session], None, None]:
+    TestingSessionLocal = sessionmaker(
+        bind=db_engine,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        class_=Session,
+    )
+    try:
+        yield TestingSessionLocal
+    finally:
+        with db_engine.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                connection.execute(table.delete())
+
+
+@pytest.fixture()
+def db_session(db_session_factory: sessionmaker[Session]) -> Generator[Session, None, None]:
+    session = db_session_factory()
+    try:
+        yield session
+    finally:
+        session.close()
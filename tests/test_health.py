@@ -1,25 +1,81 @@
 from __future__ import annotations
 
+from collections.abc import Generator
+from unittest.mock import Mock
+
 import _bootstrap  # noqa: F401
+import pytest
 from fastapi.testclient import TestClient
+from starlette.responses import Response
 
+from app.core.middleware import RequestEnvelopeMiddleware
+from app.db.session import get_session
 from app.main import app
 
 
-def test_health_live() -> None:
-    with TestClient(app) as client:
-        response = client.get("/health/live")
+@pytest.fixture(scope="module")
+def client() -> Generator[TestClient, None, None]:
+    # One client per module so the app lifespan runs once, not once per test.
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_health_live(client: TestClient) -> None:
+    response = client.get("/health/live")
 
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
     assert "charset=utf-8" in response.headers["content-type"].lower()
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_existing_charset_parameter_is_not_duplicated() -> None:
+    inner = Response(b"{}", headers={"content-type": "application/json; Charset=UTF-8"})
+
+    response = TestClient(RequestEnvelopeMiddleware(inner)).get("/")
+
+    assert response.headers["content-type"] == "application/json; Charset=UTF-8"
+
+
+def test_request_id_is_echoed_in_response(client: TestClient) -> None:
+    response = client.get("/health/live", headers={"X-Request-ID": "abc123"})
 
+    assert response.headers["x-request-id"] == "abc123"
+    assert response.headers["referrer-policy"] == "no-referrer"
 
-def test_health_ready() -> None:
-    with TestClient(app) as client:
-        response = client.get("/health/ready")
+
+def test_generated_request_ids_are_unique(client: TestClient) -> None:
+    first = client.get("/health/live").headers["x-request-id"]
+    second = client.get("/health/live").headers["x-request-id"]
+
+    assert first != second
+    assert len(first) == len(second) == 32
+
+
+def test_health_ready(client: TestClient) -> None:
+    response = client.get("/health/ready")
 
     assert response.status_code == 200
     payload = response.json()
     assert payload["status"] == "ok"
     assert payload["checks"]["db"] == "ok"
+
+
+def test_health_ready_reuses_recent_successful_probe(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("app.api.routes.health._ready_cache", None)
+
+    def broken_session() -> Generator[Mock, None, None]:
+        session = Mock()
+        session.execute.side_effect = RuntimeError("db down")
+        yield session
+
+    first = client.get("/health/ready")
+    monkeypatch.setitem(app.dependency_overrides, get_session, broken_session)
+    second = client.get("/health/ready")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json() == first.json()
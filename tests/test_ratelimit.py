@@ -8,10 +8,9 @@ import pytest
 from app.core.config import get_settings
 
 
-def test_rate_limit_disabled_is_noop(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_rate_limit_disabled_is_noop(monkeypatch: pytest.MonkeyPatch, fresh_settings: None) -> None:
     monkeypatch.setenv("RATE_LIMIT_ENABLED", "false")
     monkeypatch.setenv("RATE_LIMIT_REDIS_URL", "memory://")
-    get_settings.cache_clear()
 
     import app.core.ratelimit as ratelimit
 
@@ -38,8 +37,18 @@ def test_rate_limit_enabled_builds_limiter(monkeypatch: pytest.MonkeyPatch) -> N
     try:
         assert ratelimit.rate_limit_enabled is True
         assert ratelimit.limiter is not None
+        assert ratelimit.limiter._strategy == "moving-window"
+        # memory:// storage has no Redis client to share with the readiness probe.
+        assert ratelimit.redis_client is None
     finally:
         monkeypatch.setenv("RATE_LIMIT_ENABLED", "false")
         monkeypatch.setenv("RATE_LIMIT_REDIS_URL", "memory://")
         get_settings.cache_clear()
         importlib.reload(ratelimit)
+
+
+def test_rate_limit_rejects_malformed_limit_when_disabled() -> None:
+    import app.core.ratelimit as ratelimit
+
+    with pytest.raises(ValueError):
+        ratelimit.limit("thirty per minute")
@@ -2,19 +2,25 @@
 
 from collections.abc import Generator
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import _bootstrap  # noqa: F401
+import orjson
 import pytest
+from fastapi import HTTPException, Request
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import insert
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
-from app.db.base import Base
+from app.api.routes import summaries as summaries_routes
 from app.db.models import Summary
 from app.db.session import get_session
 from app.main import app
+from app.schemas.summary import SummaryCreate
+from app.services import orchestrator, summarizer
+from app.services.orchestrator import SummaryOrchestrator
 from app.services.summarizer import SummarizationError
 from app.services.wikipedia import ScrapingError
 
@@ -25,132 +31,114 @@ TEST_SUMMARY_PT = "Inteligência artificial é o campo de construir sistemas que
 TEST_SUMMARY_WORD_COUNT = len(TEST_SUMMARY.split())
 TEST_SUMMARY_ORIGIN = "llm"
 TEST_SUMMARY_PT_ORIGIN = "llm"
+TEST_CREATED_AT = datetime(2024, 6, 1, tzinfo=timezone.utc)
+SUMMARIES_PATH = "/summaries"
+JSON_HEADERS = {"content-type": "application/json"}
 
 
-@pytest.fixture()
-def db_session_factory() -> Generator[sessionmaker[Session], None, None]:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    TestingSessionLocal = sessionmaker(
-        bind=engine,
-        autocommit=False,
-        autoflush=False,
-        expire_on_commit=False,
-        class_=Session,
+@lru_cache
+def _summary_request_body(word_count: int) -> bytes:
+    return orjson.dumps({"url": TEST_URL, "word_count": word_count})
+
+
+def _post_summary(client: TestClient, word_count: int):
+    # Request bodies are serialized once per word count and reused across posts.
+    return client.post(
+        SUMMARIES_PATH, content=_summary_request_body(word_count), headers=JSON_HEADERS
     )
 
-    Base.metadata.create_all(bind=engine)
 
+@pytest.fixture(scope="session")
+def shared_client() -> Generator[TestClient, None, None]:
+    # Entered once so the app lifespan runs once per test session, not per test. Redirects
+    # are not followed: the API never redirects, so one should fail loudly.
+    with TestClient(app, follow_redirects=False) as test_client:
+        yield test_client
+
+
+@pytest.fixture()
+def client(
+    shared_client: TestClient,
+    db_session_factory: sessionmaker[Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> TestClient:
     def override_get_session() -> Generator[Session, None, None]:
-        session = TestingSessionLocal()
+        session = db_session_factory()
         try:
             yield session
         finally:
             session.close()
 
-    app.dependency_overrides[get_session] = override_get_session
-    try:
-        yield TestingSessionLocal
-    finally:
-        app.dependency_overrides.clear()
-        Base.metadata.drop_all(bind=engine)
-        engine.dispose()
+    # monkeypatch restores only this override, leaving any other overrides in place.
+    monkeypatch.setitem(app.dependency_overrides, get_session, override_get_session)
+    return shared_client
 
 
 @pytest.fixture()
-def client(db_session_factory: sessionmaker[Session]) -> Generator[TestClient, None, None]:
-    with TestClient(app) as test_client:
-        yield test_client
+def orchestrator_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Patch scraping and generation in the orchestrator with recording mocks."""
+
+    mocks = SimpleNamespace(
+        scrape=Mock(return_value=TEST_TEXT),
+        generate=Mock(
+            return_value=(
+                TEST_SUMMARY,
+                TEST_SUMMARY_ORIGIN,
+                TEST_SUMMARY_PT,
+                TEST_SUMMARY_PT_ORIGIN,
+            )
+        ),
+    )
+    monkeypatch.setattr(orchestrator, "get_wikipedia_article_text", mocks.scrape)
+    monkeypatch.setattr(orchestrator, "summarize_and_translate", mocks.generate)
+    return mocks
 
 
-def test_post_creates_summary_with_mocks(
-    client: TestClient, monkeypatch: pytest.MonkeyPatch
+@pytest.mark.parametrize(
+    "expected_sources",
+    [["generated"], ["generated", "cache"]],
+    ids=["single-post", "repeat-post-uses-cache"],
+)
+def test_post_creates_summary_then_serves_cache(
+    client: TestClient,
+    orchestrator_mocks: SimpleNamespace,
+    expected_sources: list[str],
 ) -> None:
-    mock_scrape = Mock(return_value=TEST_TEXT)
-    mock_summarize = Mock(return_value=(TEST_SUMMARY, TEST_SUMMARY_ORIGIN))
-    mock_translate = Mock(return_value=(TEST_SUMMARY_PT, TEST_SUMMARY_PT_ORIGIN))
-
-    monkeypatch.setattr("app.services.orchestrator.get_wikipedia_article_text", mock_scrape)
-    monkeypatch.setattr("app.services.orchestrator.summarize_text", mock_summarize)
-    monkeypatch.setattr("app.services.orchestrator.translate_summary_to_portuguese", mock_translate)
+    responses = [_post_summary(client, 50) for _ in expected_sources]
 
-    response = client.post("/summaries", json={"url": TEST_URL, "word_count": 50})
+    for response, expected_source in zip(responses, expected_sources, strict=True):
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["url"] == TEST_URL
+        assert payload["word_count"] == 50
+        assert payload["actual_word_count"] == TEST_SUMMARY_WORD_COUNT
+        assert payload["summary_origin"] == TEST_SUMMARY_ORIGIN
+        assert payload["summary_pt_origin"] == TEST_SUMMARY_PT_ORIGIN
+        assert payload["source"] == expected_source
+        assert payload["summary"] == TEST_SUMMARY
+        assert payload["summary_pt"] == TEST_SUMMARY_PT
 
-    assert response.status_code == 200
-    payload = response.json()
-    assert payload["url"] == TEST_URL
-    assert payload["word_count"] == 50
-    assert payload["actual_word_count"] == TEST_SUMMARY_WORD_COUNT
-    assert payload["summary_origin"] == TEST_SUMMARY_ORIGIN
-    assert payload["summary_pt_origin"] == TEST_SUMMARY_PT_ORIGIN
-    assert payload["source"] == "generated"
-    assert payload["summary"] == TEST_SUMMARY
-    assert payload["summary_pt"] == TEST_SUMMARY_PT
-
-    mock_scrape.assert_called_once()
-    mock_summarize.assert_called_once()
-    mock_translate.assert_called_once()
-
-
-def test_post_twice_uses_cache_and_skips_llm(
-    client: TestClient, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    mock_scrape = Mock(return_value=TEST_TEXT)
-    mock_summarize = Mock(return_value=(TEST_SUMMARY, TEST_SUMMARY_ORIGIN))
-    mock_translate = Mock(return_value=(TEST_SUMMARY_PT, TEST_SUMMARY_PT_ORIGIN))
-
-    monkeypatch.setattr("app.services.orchestrator.get_wikipedia_article_text", mock_scrape)
-    monkeypatch.setattr("app.services.orchestrator.summarize_text", mock_summarize)
-    monkeypatch.setattr("app.services.orchestrator.translate_summary_to_portuguese", mock_translate)
-
-    first = client.post("/summaries", json={"url": TEST_URL, "word_count": 60})
-    second = client.post("/summaries", json={"url": TEST_URL, "word_count": 60})
-
-    assert first.status_code == 200
-    assert second.status_code == 200
-    assert first.json()["source"] == "generated"
-    assert second.json()["source"] == "cache"
-    assert first.json()["word_count"] == 60
-    assert second.json()["word_count"] == 60
-    assert first.json()["actual_word_count"] == TEST_SUMMARY_WORD_COUNT
-    assert second.json()["actual_word_count"] == TEST_SUMMARY_WORD_COUNT
-    assert first.json()["summary_origin"] == TEST_SUMMARY_ORIGIN
-    assert second.json()["summary_origin"] == TEST_SUMMARY_ORIGIN
-    assert first.json()["summary_pt_origin"] == TEST_SUMMARY_PT_ORIGIN
-    assert second.json()["summary_pt_origin"] == TEST_SUMMARY_PT_ORIGIN
-
-    mock_scrape.assert_called_once()
-    mock_summarize.assert_called_once()
-    mock_translate.assert_called_once()
+    # Scraping and generation run once; a repeat post is answered from storage.
+    orchestrator_mocks.scrape.assert_called_once()
+    orchestrator_mocks.generate.assert_called_once()
 
 
 def test_post_with_different_word_count_generates_new_summary(
     client: TestClient,
-    monkeypatch: pytest.MonkeyPatch,
+    orchestrator_mocks: SimpleNamespace,
 ) -> None:
-    mock_scrape = Mock(return_value=TEST_TEXT)
-    mock_summarize = Mock(
-        side_effect=[
-            (TEST_SUMMARY, TEST_SUMMARY_ORIGIN),
-            (f"{TEST_SUMMARY} second", TEST_SUMMARY_ORIGIN),
-        ]
-    )
-    mock_translate = Mock(
-        side_effect=[
-            (TEST_SUMMARY_PT, TEST_SUMMARY_PT_ORIGIN),
-            (f"{TEST_SUMMARY_PT} second", TEST_SUMMARY_PT_ORIGIN),
-        ]
-    )
-
-    monkeypatch.setattr("app.services.orchestrator.get_wikipedia_article_text", mock_scrape)
-    monkeypatch.setattr("app.services.orchestrator.summarize_text", mock_summarize)
-    monkeypatch.setattr("app.services.orchestrator.translate_summary_to_portuguese", mock_translate)
-
-    first = client.post("/summaries", json={"url": TEST_URL, "word_count": 40})
-    second = client.post("/summaries", json={"url": TEST_URL, "word_count": 80})
+    orchestrator_mocks.generate.side_effect = [
+        (TEST_SUMMARY, TEST_SUMMARY_ORIGIN, TEST_SUMMARY_PT, TEST_SUMMARY_PT_ORIGIN),
+        (
+            f"{TEST_SUMMARY} second",
+            TEST_SUMMARY_ORIGIN,
+            f"{TEST_SUMMARY_PT} second",
+            TEST_SUMMARY_PT_ORIGIN,
+        ),
+    ]
+
+    first = _post_summary(client, 40)
+    second = _post_summary(client, 80)
 
     assert first.status_code == 200
     assert second.status_code == 200
@@ -163,9 +151,8 @@ def test_post_with_different_word_count_generates_new_summary(
     assert first.json()["summary_pt_origin"] == TEST_SUMMARY_PT_ORIGIN
     assert second.json()["summary_pt_origin"] == TEST_SUMMARY_PT_ORIGIN
 
-    assert mock_scrape.call_count == 2
-    assert mock_summarize.call_count == 2
-    assert mock_translate.call_count == 2
+    assert orchestrator_mocks.scrape.call_count == 2
+    assert orchestrator_mocks.generate.call_count == 2
 
 
 def test_get_returns_existing_summary(
@@ -174,22 +161,25 @@ def test_get_returns_existing_summary(
 ) -> None:
     session = db_session_factory()
     try:
-        session.add(
-            Summary(
-                url=TEST_URL,
-                summary=TEST_SUMMARY,
-                summary_pt=TEST_SUMMARY_PT,
-                word_count=120,
-                summary_origin=TEST_SUMMARY_ORIGIN,
-                summary_pt_origin=TEST_SUMMARY_PT_ORIGIN,
-                created_at=datetime.now(timezone.utc),
-            )
+        session.execute(
+            insert(Summary),
+            [
+                {
+                    "url": TEST_URL,
+                    "summary": TEST_SUMMARY,
+                    "summary_pt": TEST_SUMMARY_PT,
+                    "word_count": 120,
+                    "summary_origin": TEST_SUMMARY_ORIGIN,
+                    "summary_pt_origin": TEST_SUMMARY_PT_ORIGIN,
+                    "created_at": TEST_CREATED_AT,
+                }
+            ],
         )
         session.commit()
     finally:
         session.close()
 
-    response = client.get("/summaries", params={"url": TEST_URL})
+    response = client.get(SUMMARIES_PATH, params={"url": TEST_URL})
 
     assert response.status_code == 200
     payload = response.json()
@@ -204,7 +194,7 @@ def test_get_returns_existing_summary(
 
 
 def test_get_returns_404_when_missing(client: TestClient) -> None:
-    response = client.get("/summaries", params={"url": TEST_URL})
+    response = client.get(SUMMARIES_PATH, params={"url": TEST_URL})
 
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
@@ -216,33 +206,34 @@ def test_get_with_word_count_returns_specific_summary(
 ) -> None:
     session = db_session_factory()
     try:
-        session.add_all(
+        session.execute(
+            insert(Summary),
             [
-                Summary(
-                    url=TEST_URL,
-                    summary=TEST_SUMMARY,
-                    summary_pt=TEST_SUMMARY_PT,
-                    word_count=50,
-                    summary_origin=TEST_SUMMARY_ORIGIN,
-                    summary_pt_origin=TEST_SUMMARY_PT_ORIGIN,
-                    created_at=datetime.now(timezone.utc),
-                ),
-                Summary(
-                    url=TEST_URL,
-                    summary=f"{TEST_SUMMARY} v2",
-                    summary_pt=f"{TEST_SUMMARY_PT} v2",
-                    word_count=100,
-                    summary_origin=TEST_SUMMARY_ORIGIN,
-                    summary_pt_origin=TEST_SUMMARY_PT_ORIGIN,
-                    created_at=datetime.now(timezone.utc),
-                ),
-            ]
+                {
+                    "url": TEST_URL,
+                    "summary": TEST_SUMMARY,
+                    "summary_pt": TEST_SUMMARY_PT,
+                    "word_count": 50,
+                    "summary_origin": TEST_SUMMARY_ORIGIN,
+                    "summary_pt_origin": TEST_SUMMARY_PT_ORIGIN,
+                    "created_at": TEST_CREATED_AT,
+                },
+                {
+                    "url": TEST_URL,
+                    "summary": f"{TEST_SUMMARY} v2",
+                    "summary_pt": f"{TEST_SUMMARY_PT} v2",
+                    "word_count": 100,
+                    "summary_origin": TEST_SUMMARY_ORIGIN,
+                    "summary_pt_origin": TEST_SUMMARY_PT_ORIGIN,
+                    "created_at": TEST_CREATED_AT,
+                },
+            ],
         )
         session.commit()
     finally:
         session.close()
 
-    response = client.get("/summaries", params={"url": TEST_URL, "word_count": 100})
+    response = client.get(SUMMARIES_PATH, params={"url": TEST_URL, "word_count": 100})
 
     assert response.status_code == 200
     payload = response.json()
@@ -259,33 +250,34 @@ def test_get_without_word_count_returns_latest_summary(
 ) -> None:
     session = db_session_factory()
     try:
-        session.add_all(
+        session.execute(
+            insert(Summary),
             [
-                Summary(
-                    url=TEST_URL,
-                    summary=TEST_SUMMARY,
-                    summary_pt=TEST_SUMMARY_PT,
-                    word_count=50,
-                    summary_origin=TEST_SUMMARY_ORIGIN,
-                    summary_pt_origin=TEST_SUMMARY_PT_ORIGIN,
-                    created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
-                ),
-                Summary(
-                    url=TEST_URL,
-                    summary=f"{TEST_SUMMARY} newer",
-                    summary_pt=f"{TEST_SUMMARY_PT} newer",
-                    word_count=75,
-                    summary_origin=TEST_SUMMARY_ORIGIN,
-                    summary_pt_origin=TEST_SUMMARY_PT_ORIGIN,
-                    created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
-                ),
-            ]
+                {
+                    "url": TEST_URL,
+                    "summary": TEST_SUMMARY,
+                    "summary_pt": TEST_SUMMARY_PT,
+                    "word_count": 50,
+                    "summary_origin": TEST_SUMMARY_ORIGIN,
+                    "summary_pt_origin": TEST_SUMMARY_PT_ORIGIN,
+                    "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                },
+                {
+                    "url": TEST_URL,
+                    "summary": f"{TEST_SUMMARY} newer",
+                    "summary_pt": f"{TEST_SUMMARY_PT} newer",
+                    "word_count": 75,
+                    "summary_origin": TEST_SUMMARY_ORIGIN,
+                    "summary_pt_origin": TEST_SUMMARY_PT_ORIGIN,
+                    "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                },
+            ],
         )
         session.commit()
     finally:
         session.close()
 
-    response = client.get("/summaries", params={"url": TEST_URL})
+    response = client.get(SUMMARIES_PATH, params={"url": TEST_URL})
 
     assert response.status_code == 200
     payload = response.json()
@@ -296,46 +288,52 @@ def test_get_without_word_count_returns_latest_summary(
     assert payload["summary"].endswith("newer")
 
 
-def test_rejects_non_wikipedia_url(client: TestClient) -> None:
-    response = client.post(
-        "/summaries",
-        json={"url": "https://example.com/article", "word_count": 50},
+def _create_summary_directly(url: str, word_count: int, session: Session) -> None:
+    # Validation-only tests call the handler in-process instead of going through ASGI.
+    summaries_routes.create_summary(
+        Request({"type": "http"}),
+        SummaryCreate(url=url, word_count=word_count),
+        SummaryOrchestrator(session),
     )
 
-    assert response.status_code == 400
-    assert "wikipedia.org" in response.json()["detail"].lower()
+
+def test_rejects_non_wikipedia_url(db_session_factory: sessionmaker[Session]) -> None:
+    with db_session_factory() as session, pytest.raises(HTTPException) as exc_info:
+        _create_summary_directly("https://example.com/article", 50, session)
+
+    assert exc_info.value.status_code == 400
+    assert "wikipedia.org" in exc_info.value.detail.lower()
 
 
 def test_rejects_word_count_above_max(
-    client: TestClient,
+    db_session_factory: sessionmaker[Session],
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    monkeypatch.setattr("app.api.routes.summaries.settings.summary_word_count_max", 10)
+    monkeypatch.setattr(summaries_routes.settings, "summary_word_count_max", 10)
 
-    response = client.post(
-        "/summaries",
-        json={"url": TEST_URL, "word_count": 11},
-    )
+    with db_session_factory() as session, pytest.raises(HTTPException) as exc_info:
+        _create_summary_directly(TEST_URL, 11, session)
 
-    assert response.status_code == 422
-    assert "word_count" in response.json()["detail"].lower()
+    assert exc_info.value.status_code == 422
+    assert "word_count" in exc_info.value.detail.lower()
 
 
 def test_post_returns_summary_when_translation_fails(
     client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    mock_scrape = Mock(return_value=TEST_TEXT)
-    mock_summarize = Mock(return_value=(TEST_SUMMARY, TEST_SUMMARY_ORIGIN))
+    # The combined call omits the translation, so the separate translation is tried.
+    def invoke(*args: object, **kwargs: object) -> tuple[str, str]:
+        return f'{{"summary": "{TEST_SUMMARY}"}}', TEST_SUMMARY_ORIGIN
 
     def fail_translate(*args: object, **kwargs: object) -> tuple[str, str]:
         raise SummarizationError("translation failed")
 
-    monkeypatch.setattr("app.services.orchestrator.get_wikipedia_article_text", mock_scrape)
-    monkeypatch.setattr("app.services.orchestrator.summarize_text", mock_summarize)
-    monkeypatch.setattr("app.services.orchestrator.translate_summary_to_portuguese", fail_translate)
+    monkeypatch.setattr(orchestrator, "get_wikipedia_article_text", lambda url: TEST_TEXT)
+    monkeypatch.setattr(summarizer, "_invoke_with_fallback", invoke)
+    monkeypatch.setattr(summarizer, "translate_summary_to_portuguese", fail_translate)
 
-    response = client.post("/summaries", json={"url": TEST_URL, "word_count": 50})
+    response = _post_summary(client, 50)
 
     assert response.status_code == 200
     payload = response.json()
@@ -349,11 +347,39 @@ def test_post_returns_502_when_scraping_fails(
     client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    mock_scrape = Mock(side_effect=ScrapingError("boom"))
+    def fail_scrape(url: str) -> str:
+        raise ScrapingError("boom")
 
-    monkeypatch.setattr("app.services.orchestrator.get_wikipedia_article_text", mock_scrape)
+    monkeypatch.setattr(orchestrator, "get_wikipedia_article_text", fail_scrape)
 
-    response = client.post("/summaries", json={"url": TEST_URL, "word_count": 50})
+    response = _post_summary(client, 50)
 
     assert response.status_code == 502
     assert "wikipedia scraping failed" in response.json()["detail"].lower()
+
+
+def test_generation_does_not_hold_a_db_transaction(
+    db_session_factory: sessionmaker[Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = db_session_factory()
+    in_transaction: list[bool] = []
+
+    def scrape(url: str) -> str:
+        in_transaction.append(session.in_transaction())
+        return TEST_TEXT
+
+    monkeypatch.setattr(orchestrator, "get_wikipedia_article_text", scrape)
+    monkeypatch.setattr(
+        orchestrator,
+        "summarize_and_translate",
+        lambda text, word_count: (TEST_SUMMARY, TEST_SUMMARY_ORIGIN, None, "disabled"),
+    )
+
+    try:
+        _, source = SummaryOrchestrator(session).get_or_create_summary(TEST_URL, 50)
+    finally:
+        session.close()
+
+    assert source == "generated"
+    assert in_transaction == [False]
@@ -1,60 +1,97 @@
 ﻿from __future__ import annotations
 
 import _bootstrap  # noqa: F401
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+import pytest
+from sqlalchemy.orm import Session
 
-from app.db.base import Base
 from app.db.models import Summary
 from app.repositories import summaries as summaries_repo
+from app.repositories import summary_cache
 
 TEST_URL = "https://en.wikipedia.org/wiki/Artificial_intelligence"
 
 
-def test_create_summary_handles_integrity_error() -> None:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+def test_create_summary_handles_integrity_error(db_session: Session) -> None:
+    existing = Summary(
+        url=TEST_URL,
+        summary="Existing summary",
+        summary_pt=None,
+        word_count=50,
+        summary_origin="llm",
+        summary_pt_origin="disabled",
     )
-    TestingSessionLocal = sessionmaker(
-        bind=engine,
-        autocommit=False,
-        autoflush=False,
-        expire_on_commit=False,
-        class_=Session,
+    db_session.add(existing)
+    db_session.commit()
+
+    summary, created = summaries_repo.create_summary(
+        db_session,
+        url=TEST_URL,
+        summary_text="New summary",
+        summary_pt=None,
+        word_count=50,
+        summary_origin="llm",
+        summary_pt_origin="disabled",
+    )
+
+    assert created is False
+    assert summary.id == existing.id
+    assert summary.summary == existing.summary
+
+
+def test_create_summary_returns_inserted_row(db_session: Session) -> None:
+    summary, created = summaries_repo.create_summary(
+        db_session,
+        url=TEST_URL,
+        summary_text="Brand new summary",
+        summary_pt=None,
+        word_count=50,
+        summary_origin="llm",
+        summary_pt_origin="disabled",
+    )
+
+    assert created is True
+    assert summary.id is not None
+    assert summary.actual_word_count == 3
+    assert summary.created_at is not None
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self.data[key] = value
+
+
+def test_summary_cache_serves_repeat_reads_from_redis(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake_redis = _FakeRedis()
+    monkeypatch.setattr("app.core.ratelimit.redis_client", fake_redis)
+
+    stored, _ = summaries_repo.create_summary(
+        db_session,
+        url=TEST_URL,
+        summary_text="Cached summary",
+        summary_pt=None,
+        word_count=50,
+        summary_origin="llm",
+        summary_pt_origin="disabled",
     )
 
-    Base.metadata.create_all(bind=engine)
-
-    session = TestingSessionLocal()
-    try:
-        existing = Summary(
-            url=TEST_URL,
-            summary="Existing summary",
-            summary_pt=None,
-            word_count=50,
-            summary_origin="llm",
-            summary_pt_origin="disabled",
-        )
-        session.add(existing)
-        session.commit()
-
-        summary, created = summaries_repo.create_summary(
-            session,
-            url=TEST_URL,
-            summary_text="New summary",
-            summary_pt=None,
-            word_count=50,
-            summary_origin="llm",
-            summary_pt_origin="disabled",
-        )
-
-        assert created is False
-        assert summary.id == existing.id
-        assert summary.summary == existing.summary
-    finally:
-        session.close()
-        Base.metadata.drop_all(bind=engine)
-        engine.dispose()
+    first = summary_cache.get_by_url_and_word_count(db_session, TEST_URL, 50)
+    assert first is not None
+    assert len(fake_redis.data) == 1
+
+    db_session.delete(stored)
+    db_session.commit()
+
+    cached = summary_cache.get_by_url_and_word_count(db_session, TEST_URL, 50)
+    assert cached is not None
+    assert cached.id == stored.id
+    assert cached.summary == "Cached summary"
+    assert cached.actual_word_count == 2
+    assert cached.created_at == stored.created_at
@@ -1,15 +1,32 @@
 ﻿from __future__ import annotations
 
+import re
+import threading
+import time
+
 import _bootstrap  # noqa: F401
 import pytest
 
 from app.core.config import get_settings
+from app.llm.client import build_llm
 from app.services.summarizer import (
+    MAP_CHUNK_WORDS,
+    MAP_REDUCE_THRESHOLD_WORDS,
+    SUMMARY_ORIGIN_LLM,
     TRANSLATION_ORIGIN_DISABLED,
     TRANSLATION_ORIGIN_LLM,
     TRANSLATION_ORIGIN_SKIPPED,
     TRANSLATION_ORIGIN_UNAVAILABLE,
     SummarizationError,
+    _content_to_text,
+    _fallback_summary,
+    _get_fallback_model,
+    _map_reduce_chunks,
+    _split_text_into_chunks,
+    _summarize_map_reduce,
+    _truncate_to_word_limit,
+    _try_parse_json,
+    summarize_and_translate,
     translate_summary_to_portuguese,
 )
 
@@ -26,32 +43,28 @@ def test_translate_skips_when_summary_is_already_portuguese() -> None:
     assert origin == TRANSLATION_ORIGIN_SKIPPED
 
 
-def test_translate_returns_disabled_when_flag_off(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_translate_returns_disabled_when_flag_off(
+    monkeypatch: pytest.MonkeyPatch, fresh_settings: None
+) -> None:
     summary_en = "This is an English summary that should not be translated. " * 3
     monkeypatch.setenv("ENABLE_PORTUGUESE_TRANSLATION", "false")
-    get_settings.cache_clear()
 
-    try:
-        translated, origin = translate_summary_to_portuguese(summary_en, word_count=80)
-        assert translated is None
-        assert origin == TRANSLATION_ORIGIN_DISABLED
-    finally:
-        get_settings.cache_clear()
+    translated, origin = translate_summary_to_portuguese(summary_en, word_count=80)
+
+    assert translated is None
+    assert origin == TRANSLATION_ORIGIN_DISABLED
 
 
 def test_translate_returns_unavailable_when_key_placeholder(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, fresh_settings: None
 ) -> None:
     summary_en = "This is an English summary that should not be translated. " * 3
     monkeypatch.setenv("OPENAI_API_KEY", "your-openai-api-key")
-    get_settings.cache_clear()
 
-    try:
-        translated, origin = translate_summary_to_portuguese(summary_en, word_count=80)
-        assert translated is None
-        assert origin == TRANSLATION_ORIGIN_UNAVAILABLE
-    finally:
-        get_settings.cache_clear()
+    translated, origin = translate_summary_to_portuguese(summary_en, word_count=80)
+
+    assert translated is None
+    assert origin == TRANSLATION_ORIGIN_UNAVAILABLE
 
 
 def test_translate_raises_when_llm_fails(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -83,3 +96,160 @@ def test_translate_does_not_skip_for_english_with_names(monkeypatch: pytest.Monk
 
     assert translated is not None
     assert origin == TRANSLATION_ORIGIN_LLM
+
+
+def test_map_reduce_keeps_chunk_order_when_map_runs_in_parallel(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    chunks = [" ".join([f"chunk{idx}"] * MAP_CHUNK_WORDS) for idx in range(1, 4)]
+    reduce_prompts: list[str] = []
+
+    def fake_invoke(messages: list, *, purpose: str, **kwargs: object) -> tuple[str, str]:
+        human_prompt = messages[-1].content
+        if purpose == "summary-reduce":
+            reduce_prompts.append(human_prompt)
+            return '{"summary": "Final summary."}', SUMMARY_ORIGIN_LLM
+        match = re.search(r"chunk(\d+)", human_prompt)
+        assert match is not None
+        chunk_idx = int(match.group(1))
+        # Later chunks finish first to prove results are reassembled in input order.
+        time.sleep(0.01 * (4 - chunk_idx))
+        return f'{{"summary": "Part {chunk_idx}."}}', SUMMARY_ORIGIN_LLM
+
+    monkeypatch.setattr("app.services.summarizer._invoke_with_fallback", fake_invoke)
+
+    summary, origin = _summarize_map_reduce(chunks, word_count=80)
+
+    assert summary == "Final summary."
+    assert origin == SUMMARY_ORIGIN_LLM
+    assert len(reduce_prompts) == 1
+    positions = [reduce_prompts[0].index(f"Part {idx}.") for idx in range(1, 4)]
+    assert positions == sorted(positions)
+
+
+def test_map_reduce_does_not_wait_for_other_chunks_after_a_failure(
+    monkeypatch: pytest.MonkeyPatch, fresh_settings: None
+) -> None:
+    chunks = [" ".join([f"chunk{idx}"] * MAP_CHUNK_WORDS) for idx in range(1, 5)]
+    release = threading.Event()
+    monkeypatch.setenv("LLM_MAX_PARALLEL_CHUNKS", "2")
+
+    def fake_invoke(messages: list, *, purpose: str, **kwargs: object) -> tuple[str, str]:
+        if "chunk2" in messages[-1].content:
+            raise SummarizationError("boom")
+        release.wait(timeout=5)
+        return '{"summary": "Part."}', SUMMARY_ORIGIN_LLM
+
+    monkeypatch.setattr("app.services.summarizer._invoke_with_fallback", fake_invoke)
+
+    started = time.perf_counter()
+    try:
+        with pytest.raises(SummarizationError):
+            _summarize_map_reduce(chunks, word_count=80)
+        assert time.perf_counter() - started < 2
+    finally:
+        release.set()
+
+
+def test_try_parse_json_handles_fences_and_surrounding_text() -> None:
+    assert _try_parse_json('```json\n{"summary": "Fenced."}\n```') == {"summary": "Fenced."}
+    assert _try_parse_json('Sure! {"summary": "Embedded."} Done.') == {"summary": "Embedded."}
+    assert _try_parse_json("not json at all") is None
+    assert _try_parse_json('["not", "an", "object"]') is None
+
+
+def test_split_text_into_chunks_groups_words() -> None:
+    text = " ".join(f"w{idx}" for idx in range(7))
+
+    assert _split_text_into_chunks(text, 3) == ["w0 w1 w2", "w3 w4 w5", "w6"]
+    assert _split_text_into_chunks("", 3) == []
+
+
+def test_map_reduce_chunks_only_splits_past_the_threshold() -> None:
+    below = " ".join(["word"] * (MAP_REDUCE_THRESHOLD_WORDS - 1))
+    at_threshold = f"{below} word"
+
+    assert _map_reduce_chunks(below) is None
+    assert _map_reduce_chunks(at_threshold) == _split_text_into_chunks(
+        at_threshold, MAP_CHUNK_WORDS
+    )
+
+
+def test_truncate_to_word_limit_only_trims_when_over_limit() -> None:
+    assert _truncate_to_word_limit("  one two three  ", 3) == "one two three"
+    assert _truncate_to_word_limit("one  two\nthree four", 3) == "one two three."
+
+
+def test_build_llm_reuses_client_per_model() -> None:
+    assert build_llm() is build_llm()
+    assert build_llm("other-model") is not build_llm()
+
+
+def test_fallback_summary_keeps_first_five_sentences() -> None:
+    text = " ".join(f"Sentence number {idx} is here." for idx in range(1, 8))
+
+    summary = _fallback_summary(text, word_count=100)
+
+    assert summary.endswith("Sentence number 5 is here.")
+    assert "Sentence number 6" not in summary
+
+
+def test_summarize_and_translate_uses_one_llm_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    purposes: list[str] = []
+
+    def fake_invoke(messages: list, *, purpose: str, **kwargs: object) -> tuple[str, str]:
+        purposes.append(purpose)
+        return (
+            '{"summary": "An English summary.", "translation": "Um resumo em portugues."}',
+            SUMMARY_ORIGIN_LLM,
+        )
+
+    monkeypatch.setattr("app.services.summarizer._invoke_with_fallback", fake_invoke)
+
+    result = summarize_and_translate("Some article text about a topic. " * 20, word_count=50)
+
+    assert result == (
+        "An English summary.",
+        SUMMARY_ORIGIN_LLM,
+        "Um resumo em portugues.",
+        TRANSLATION_ORIGIN_LLM,
+    )
+    assert purposes == ["summary-translation"]
+
+
+def test_summarize_and_translate_folds_translation_into_reduce(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    text = " ".join(" ".join([f"chunk{idx}"] * MAP_CHUNK_WORDS) for idx in range(1, 3))
+    purposes: list[str] = []
+
+    def fake_invoke(messages: list, *, purpose: str, **kwargs: object) -> tuple[str, str]:
+        purposes.append(purpose)
+        if purpose == "summary-map":
+            return '{"summary": "Part."}', SUMMARY_ORIGIN_LLM
+        return '{"summary": "Final.", "translation": "Final pt."}', SUMMARY_ORIGIN_LLM
+
+    monkeypatch.setattr("app.services.summarizer._invoke_with_fallback", fake_invoke)
+
+    summary, _, summary_pt, _ = summarize_and_translate(text, word_count=80)
+
+    assert (summary, summary_pt) == ("Final.", "Final pt.")
+    assert sorted(purposes) == ["summary-map", "summary-map", "summary-translation"]
+
+
+def test_content_to_text_joins_content_blocks() -> None:
+    content = ["  First  part.", {"type": "text", "text": "Second\npart."}, "   ", {"other": 1}]
+
+    assert _content_to_text(content) == "First part. Second part."
+    assert _content_to_text("  plain \n text ") == "plain text"
+
+
+def test_fallback_model_ignores_primary_model(
+    monkeypatch: pytest.MonkeyPatch, fresh_settings: None
+) -> None:
+    monkeypatch.setenv("OPENAI_FALLBACK_MODEL", "test-model")
+    assert _get_fallback_model() is None
+
+    monkeypatch.setenv("OPENAI_FALLBACK_MODEL", " backup-model ")
+    get_settings.cache_clear()
+    assert _get_fallback_model() == "backup-model"
@@ -1,13 +1,16 @@
 ﻿from __future__ import annotations
 
+import gzip
+
 import _bootstrap  # noqa: F401
 import httpx
 import pytest
 
-from app.core.config import get_settings
 from app.services.wikipedia import (
     ScrapingError,
     URLValidationError,
+    _get_client,
+    close_client,
     get_wikipedia_article_text,
     normalize_wikipedia_url,
 )
@@ -42,6 +45,18 @@ def test_normalize_url_rejects_non_wikipedia() -> None:
         normalize_wikipedia_url("https://example.com/wiki/AI")
 
 
+def test_normalize_url_caches_results_but_not_errors() -> None:
+    url = "https://pt.wikipedia.org/wiki/Intelig%C3%AAncia_artificial"
+    normalize_wikipedia_url(url)
+    hits = normalize_wikipedia_url.cache_info().hits
+
+    assert normalize_wikipedia_url(url) == url
+    assert normalize_wikipedia_url.cache_info().hits == hits + 1
+    for _ in range(2):
+        with pytest.raises(URLValidationError):
+            normalize_wikipedia_url("https://example.com/wiki/AI")
+
+
 def test_normalize_url_converts_index_php() -> None:
     url = "https://en.wikipedia.org/w/index.php?title=Artificial_intelligence"
 
@@ -58,37 +73,88 @@ def test_fetch_rejects_redirect_to_non_wikipedia(monkeypatch: pytest.MonkeyPatch
         )
 
     transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        "app.services.wikipedia._client",
+        httpx.Client(transport=transport, follow_redirects=False),
+    )
+
+    with pytest.raises(URLValidationError):
+        get_wikipedia_article_text("https://en.wikipedia.org/wiki/Artificial_intelligence")
 
-    original_client = httpx.Client
 
-    def client_factory(*args: object, **kwargs: object) -> httpx.Client:
-        kwargs["transport"] = transport
-        return original_client(*args, **kwargs)
+def test_fetch_rejects_oversized_content(
+    monkeypatch: pytest.MonkeyPatch, fresh_settings: None
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code=200, content=b"x" * 64)
 
-    monkeypatch.setattr("app.services.wikipedia.httpx.Client", client_factory)
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        "app.services.wikipedia._client",
+        httpx.Client(transport=transport, follow_redirects=False),
+    )
+    monkeypatch.setenv("WIKIPEDIA_MAX_CONTENT_BYTES", "16")
 
-    with pytest.raises(URLValidationError):
+    with pytest.raises(ScrapingError):
         get_wikipedia_article_text("https://en.wikipedia.org/wiki/Artificial_intelligence")
 
 
-def test_fetch_rejects_oversized_content(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_fetch_limits_decompressed_size(
+    monkeypatch: pytest.MonkeyPatch, fresh_settings: None
+) -> None:
     def handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(status_code=200, content=b"x" * 64)
+        return httpx.Response(
+            status_code=200,
+            content=gzip.compress(b"x" * 4096),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    monkeypatch.setenv("WIKIPEDIA_MAX_CONTENT_BYTES", "1024")
+    monkeypatch.setattr("app.services.wikipedia._client", None)
+    assert "gzip" in _get_client().headers["Accept-Encoding"]
+    close_client()
 
     transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        "app.services.wikipedia._client",
+        httpx.Client(transport=transport, follow_redirects=False),
+    )
 
-    original_client = httpx.Client
+    with pytest.raises(ScrapingError, match="maximum allowed size"):
+        get_wikipedia_article_text("https://en.wikipedia.org/wiki/Artificial_intelligence")
 
-    def client_factory(*args: object, **kwargs: object) -> httpx.Client:
-        kwargs["transport"] = transport
-        return original_client(*args, **kwargs)
 
-    monkeypatch.setattr("app.services.wikipedia.httpx.Client", client_factory)
-    monkeypatch.setenv("WIKIPEDIA_MAX_CONTENT_BYTES", "16")
-    get_settings.cache_clear()
+def test_article_text_drops_boilerplate_and_references(monkeypatch: pytest.MonkeyPatch) -> None:
+    body = " ".join(["Alan Turing studied computation and machine intelligence."] * 10)
+    html = f"""
+    <html><body><div id="mw-content-text"><div class="mw-parser-output">
+      <table class="infobox"><tr><td>Infobox<sup class="reference">[3]</sup></td></tr></table>
+      <p>{body}<sup class="reference">[1]</sup> Later work[2] followed.</p>
+      <p>   </p>
+      <ol class="references"><li>Reference text</li></ol>
+      <script>var hidden = "script";</script>
+    </div></div></body></html>
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code=200, text=html)
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        "app.services.wikipedia._client",
+        httpx.Client(transport=transport, follow_redirects=False),
+    )
+
+    text = get_wikipedia_article_text("https://en.wikipedia.org/wiki/Alan_Turing")
+
+    assert text == f"{body} Later work followed."
+
+
+def test_client_is_shared_until_closed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.services.wikipedia._client", None)
+
+    client = _get_client()
 
-    try:
-        with pytest.raises(ScrapingError):
-            get_wikipedia_article_text("https://en.wikipedia.org/wiki/Artificial_intelligence")
-    finally:
-        get_settings.cache_clear()
+    assert _get_client() is client
+    close_client()
+    assert client.is_closed